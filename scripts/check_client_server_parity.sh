@@ -15,8 +15,8 @@ CLIENT_FUNCTIONS=$(grep -E "^    def [a-z][a-z_]*\(" "$CLIENT_FILE" | \
     sort | uniq)
 
 # Extract tool function names from server
-# Tools are decorated with @mcp.tool() and defined as "def function_name(" on the next line
-SERVER_TOOLS=$(grep -A1 "@mcp.tool()" "$SERVER_FILE" | \
+# Tools are decorated with @_tool() and defined as "def function_name(" on the next line
+SERVER_TOOLS=$(grep -A1 "^@_tool(" "$SERVER_FILE" | \
     grep "^def " | \
     sed 's/def \([a-z_]*\).*/\1/' | \
     sort | uniq)
@@ -25,6 +25,9 @@ SERVER_TOOLS=$(grep -A1 "@mcp.tool()" "$SERVER_FILE" | \
 # (single-item methods delegate to batch versions internally)
 BATCH_COVERED="create_task create_project create_tag create_folder update_task update_project update_tag update_folder"
 
+# Connector methods used internally by tools, not exposed as tools themselves
+INTERNAL_HELPERS="set_autosave restore_autosave"
+
 # Find functions missing from server
 MISSING=()
 for func in $CLIENT_FUNCTIONS; do
@@ -32,6 +35,10 @@ for func in $CLIENT_FUNCTIONS; do
     if echo "$BATCH_COVERED" | grep -q "\b${func}\b"; then
         continue
     fi
+    # Skip internal helpers
+    if echo "$INTERNAL_HELPERS" | grep -q "\b${func}\b"; then
+        continue
+    fi
     # Tool name might be exactly the same or have slight variations
     if ! echo "$SERVER_TOOLS" | grep -q "^${func}$"; then
         MISSING+=("$func")
@@ -51,7 +58,7 @@ else
     printf '  - %s\n' "${MISSING[@]}"
     echo ""
     echo "Action required:"
-    echo "1. Add @mcp.tool() wrapper in $SERVER_FILE for each missing function"
+    echo "1. Add @_tool() wrapper in $SERVER_FILE for each missing function"
     echo "2. Write e2e test in tests/test_e2e_mcp_tools.py"
     echo "3. Re-run this check"
     exit 1
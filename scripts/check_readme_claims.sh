@@ -17,11 +17,11 @@ echo ""
 
 # --- Check 1: Tool count ---
 echo "--- Check 1: MCP tool count ---"
-ACTUAL_TOOLS=$(grep -c "@mcp.tool()" "$SERVER")
+ACTUAL_TOOLS=$(grep -c "^@_tool(" "$SERVER")
 README_TOOLS=$(grep -oE 'Tools \([0-9]+\)' "$README" | grep -oE '[0-9]+')
 
 if [ "$ACTUAL_TOOLS" != "$README_TOOLS" ]; then
-    echo "ERROR: README says Tools ($README_TOOLS) but server has $ACTUAL_TOOLS @mcp.tool() decorators"
+    echo "ERROR: README says Tools ($README_TOOLS) but server has $ACTUAL_TOOLS @_tool() decorators"
     ERRORS=$((ERRORS + 1))
 else
     echo "OK: Tool count matches ($ACTUAL_TOOLS)"
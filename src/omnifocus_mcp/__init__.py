@@ -2,6 +2,11 @@
 
 __version__ = "0.13.2"
 
+import logging
+
+# Library default: stay silent unless the host application configures logging
+logging.getLogger(__name__).addHandler(logging.NullHandler())
+
 from .omnifocus_connector import OmniFocusConnector, run_applescript
 
 __all__ = ["OmniFocusConnector", "run_applescript"]
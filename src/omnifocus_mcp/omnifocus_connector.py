@@ -11,6 +11,14 @@ from typing import Any, Optional, Union
 
 logger = logging.getLogger(__name__)
 
+# osascript output for large databases runs to megabytes of JSON; parse it with
+# orjson when installed (optional "fast" extra). orjson.JSONDecodeError
+# subclasses json.JSONDecodeError, so existing except clauses still apply.
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
 
 class TaskStatus(Enum):
     """Task status values for OmniFocus tasks."""
@@ -291,6 +299,54 @@ class OmniFocusConnector:
         )
         return f"every {entity_type} whose {clauses}"
 
+    # AppleScript tail for batch scripts: the success count on the first line,
+    # then one failed ID per line (see _parse_batch_result).
+    _BATCH_RESULT_RETURN = '''
+                set AppleScript's text item delimiters to linefeed
+                set batchResult to (successCount as text) & linefeed & (failedIds as text)
+                set AppleScript's text item delimiters to ""
+                return batchResult'''
+
+    @staticmethod
+    def _parse_batch_result(
+        result: str, ids_list: list[str], id_key: str, error: str
+    ) -> tuple[int, list[str], list[dict]]:
+        """Parse a batch script's "count\\nfailedId..." output.
+
+        Returns (success_count, succeeded_ids, failures), where failures are
+        ``{id_key: <id>, "error": error}`` dicts in input order. If the script
+        reported fewer successes without naming the failed IDs, the first
+        ``success_count`` input IDs are assumed to have succeeded.
+        """
+        lines = result.strip().splitlines()
+        success_count = int(lines[0])
+        failed = set(line for line in lines[1:] if line)
+        if failed:
+            succeeded_ids = [i for i in ids_list if i not in failed]
+            failed_ids = [i for i in ids_list if i in failed]
+        else:
+            succeeded_ids = ids_list[:success_count]
+            failed_ids = ids_list[success_count:]
+        failures = [{id_key: i, "error": error} for i in failed_ids]
+        return success_count, succeeded_ids, failures
+
+    def _run_batch_script(self, script: str) -> str:
+        """Run a batch script that suspends autosave in-script.
+
+        The script only turns autosave back on when it reaches its end. If
+        osascript fails, times out or is killed first, autosave is restored
+        here so OmniFocus does not keep unsaved changes for the rest of the
+        session; the original error is re-raised.
+        """
+        try:
+            return run_applescript(script)
+        except (subprocess.CalledProcessError, subprocess.TimeoutExpired):
+            try:
+                self.restore_autosave()
+            except Exception as e:
+                logger.warning("Could not re-enable OmniFocus autosave: %s", e)
+            raise
+
     def _get_tasks_batch_for_filtering(
         self,
         project_ids: list[str]
@@ -395,7 +451,7 @@ class OmniFocusConnector:
 
         # Parse JSON result
         import json
-        projects_data = json.loads(result)
+        projects_data = _json_loads(result)
 
         # Convert to dict[project_id -> list[task]]
         tasks_by_project = {}
@@ -939,6 +995,20 @@ class OmniFocusConnector:
             else:
                 p["projectType"] = "parallel"
 
+    @staticmethod
+    def _note_truncation_block(note_var: str, note_limit: Optional[int]) -> str:
+        """AppleScript that truncates ``note_var`` in place to ``note_limit`` chars.
+
+        Truncating before JSON encoding keeps long notes out of the osascript
+        output entirely. Returns "" when ``note_limit`` is None (full notes).
+        """
+        if note_limit is None:
+            return ""
+        return (
+            f'if (length of {note_var}) > {int(note_limit)} then '
+            f'set {note_var} to (text 1 thru {int(note_limit)} of {note_var}) & "..."'
+        )
+
     @staticmethod
     def _filter_projects_by_query(
         projects: list[dict[str, Any]], query: str
@@ -1057,6 +1127,7 @@ class OmniFocusConnector:
         self,
         project_id: Optional[str] = None,  # NEW (Phase 3.2): Filter to specific project
         include_full_notes: bool = False,  # NEW (Phase 3.2): Return full notes
+        note_limit: Optional[int] = None,
         on_hold_only: bool = False,
         modified_after: Optional[str] = None,
         modified_before: Optional[str] = None,
@@ -1093,6 +1164,10 @@ class OmniFocusConnector:
         Args:
             project_id: Filter to specific project by ID (optional)
             include_full_notes: Return full note content (default: False)
+            note_limit: Truncate notes to this many characters (plus "...") inside
+                AppleScript, before they cross the pipe. Ignored when query is set,
+                since query matching runs in Python over the full note.
+                None returns full notes (default: None)
             on_hold_only: Only return projects with "on hold" status (default: False)
             include_dropped: Include dropped projects in results (default: False)
             include_completed: Include completed projects in results (default: False)
@@ -1133,9 +1208,17 @@ class OmniFocusConnector:
         if project_id:
             project_id_escaped = self._escape_applescript_string(project_id)
             project_source = f'(flattened projects whose id is "{project_id_escaped}")'
+        elif flagged_only:
+            # Let OmniFocus drop unflagged projects before the bulk property reads
+            project_source = '(flattened projects whose flagged is true)'
         else:
             project_source = 'flattened projects'
 
+        # Truncate notes in AppleScript unless Python-side query needs the full text
+        note_truncation = self._note_truncation_block(
+            "projNote", None if query else note_limit
+        )
+
         # stalled_only requires task health data
         if stalled_only:
             include_task_health = True
@@ -1341,11 +1424,14 @@ class OmniFocusConnector:
                             set AppleScript's text item delimiters to ""
                         end if
 
+                        set projNote to item i of notes
+                        {note_truncation}
+
                         -- Build JSON
                         set jsonLine to "{{" & ¬
                             "\\"id\\": \\"" & (item i of ids) & "\\", " & ¬
                             "\\"name\\": \\"" & my escapeJSON(item i of names) & "\\", " & ¬
-                            "\\"note\\": \\"" & my escapeJSON(item i of notes) & "\\", " & ¬
+                            "\\"note\\": \\"" & my escapeJSON(projNote) & "\\", " & ¬
                             "\\"status\\": \\"" & projStatus & "\\", " & ¬
                             "\\"sequential\\": " & ((item i of seqs) as text) & ", " & ¬
                             "\\"singletonActionHolder\\": " & ((item i of singletons) as text) & ", " & ¬
@@ -1382,6 +1468,7 @@ class OmniFocusConnector:
         script = script.format(
             project_source=project_source,
             status_filter_condition=status_filter_condition,
+            note_truncation=note_truncation,
             task_ops_preamble=task_ops_preamble,
             health_init=health_init,
             task_ops_block=task_ops_block,
@@ -1391,7 +1478,7 @@ class OmniFocusConnector:
         try:
             result = run_applescript_read(script, timeout=timeout)
             if result:
-                projects = json.loads(result)
+                projects = _json_loads(result)
 
                 return self._post_process_projects(
                     projects,
@@ -1663,9 +1750,6 @@ class OmniFocusConnector:
         Raises:
             ValueError: If project_id is empty, no fields provided, invalid status, or conflicting tag params
         """
-        # SAFETY: Verify database before modifying
-        self._verify_database_safety('update_project')
-
         if not project_id:
             raise ValueError("project_id is required")
 
@@ -1705,6 +1789,9 @@ class OmniFocusConnector:
         if all(v is None for v in all_fields.values()):
             raise ValueError("At least one field must be provided to update")
 
+        # SAFETY: Verify database before modifying
+        self._verify_database_safety('update_project')
+
         # Validate and normalize status
         status_str = None
         if status is not None:
@@ -2072,11 +2159,6 @@ class OmniFocusConnector:
                 "failures": [{"project_id": str, "error": str}, ...]  # Failed updates with errors
             }
 
-        Note:
-            ``updated_ids`` is approximate on partial failure — it lists
-            the first N IDs from the input, not necessarily the ones that
-            succeeded.
-
         Raises:
             ValueError: If project_name or note parameters are provided, or no fields to update
             TypeError: If project_ids is missing
@@ -2089,9 +2171,6 @@ class OmniFocusConnector:
             )
             # result = {"updated_count": 3, "failed_count": 0, "updated_ids": [...], "failures": []}
         """
-        # SAFETY: Verify database before modifying
-        self._verify_database_safety('update_projects')
-
         # Validate that project_name and note are NOT provided
         if 'project_name' in kwargs:
             raise ValueError(
@@ -2114,6 +2193,9 @@ class OmniFocusConnector:
                 add_tags is None and remove_tags is None):
             raise ValueError("At least one field must be provided to update")
 
+        # SAFETY: Verify database before modifying
+        self._verify_database_safety('update_projects')
+
         # Normalize project_ids to list
         if isinstance(project_ids, str):
             ids_list = [project_ids]
@@ -2291,6 +2373,10 @@ class OmniFocusConnector:
             per_project_block = f'''
                 set projectIdList to {{{ids_applescript}}}
                 set successCount to 0
+                set failedIds to {{}}
+                -- Suspend autosave so OmniFocus saves once, not after every item
+                set previousAutosave to will autosave
+                set will autosave to false
 
                 repeat with projectId in projectIdList
                     try
@@ -2298,18 +2384,29 @@ class OmniFocusConnector:
                         {per_project_cmds_str}
                         set successCount to successCount + 1
                     on error
-                        -- Project not found or update failed, skip
+                        -- Project not found or update failed: report it, continue
+                        set end of failedIds to (contents of projectId)
                     end try
-                end repeat'''
+                end repeat
+                set will autosave to previousAutosave'''
 
+        # Result: bulk-only reports IDs the whose-chain did not match (one
+        # Apple Event for the found IDs); per-project loops record their failures
         if has_bulk and not has_per_project:
-            count_expr = f"count of ({or_chain_target})"
+            ids_applescript = ", ".join(
+                [f'"{self._escape_applescript_string(pid)}"' for pid in ids_list]
+            )
             script = f'''
         tell application "OmniFocus"
             tell front document
-                set preCount to ({count_expr})
+                set foundIds to id of ({or_chain_target})
                 {bulk_block}
-                return preCount as text
+                set successCount to count of foundIds
+                set failedIds to {{}}
+                repeat with projectId in {{{ids_applescript}}}
+                    if foundIds does not contain (contents of projectId) then set end of failedIds to (contents of projectId)
+                end repeat
+                {self._BATCH_RESULT_RETURN}
             end tell
         end tell
         '''
@@ -2318,7 +2415,7 @@ class OmniFocusConnector:
         tell application "OmniFocus"
             tell front document
                 {per_project_block}
-                return successCount as text
+                {self._BATCH_RESULT_RETURN}
             end tell
         end tell
         '''
@@ -2329,27 +2426,27 @@ class OmniFocusConnector:
             tell front document
                 {bulk_block}
                 {per_project_block}
-                return successCount as text
+                {self._BATCH_RESULT_RETURN}
             end tell
         end tell
         '''
 
         try:
-            result = run_applescript(script)
-            updated_count = int(result.strip())
-            total_count = len(ids_list)
-            failed_count = total_count - updated_count
-
-            updated_ids = ids_list[:updated_count] if updated_count > 0 else []
+            result = self._run_batch_script(script)
+            updated_count, updated_ids, failures = self._parse_batch_result(
+                result, ids_list, "project_id", "Project not found or update failed"
+            )
 
             return {
                 "updated_count": updated_count,
-                "failed_count": failed_count,
+                "failed_count": len(ids_list) - updated_count,
                 "updated_ids": updated_ids,
-                "failures": []  # Batch AppleScript doesn't provide per-project failure detail
+                "failures": failures,
             }
         except subprocess.CalledProcessError as e:
             raise Exception(f"Error batch updating projects: {e.stderr}")
+        except ValueError as e:
+            raise Exception(f"Error parsing update result: {e}")
 
 
 
@@ -2403,13 +2500,14 @@ class OmniFocusConnector:
             # Create subtask
             task_id = client.create_task("Subtask", parent_task_id="task-parent")
         """
-        # SAFETY: Verify database before modifying
-        self._verify_database_safety('create_task')
-
         # Validation: Cannot specify both project_id and parent_task_id
         if project_id is not None and parent_task_id is not None:
             raise ValueError("Cannot specify both project_id and parent_task_id")
 
+        # SAFETY: Verify database before modifying (after argument checks,
+        # which need no AppleScript round-trip)
+        self._verify_database_safety('create_task')
+
         # Escape strings for AppleScript
         task_name_escaped = self._escape_applescript_string(task_name)
         note_escaped = self._escape_applescript_string(note or "")
@@ -3090,12 +3188,15 @@ class OmniFocusConnector:
         task_source: str,
         on_hold_tags_decl: str,
         filter_checks: dict[str, str],
+        note_limit: Optional[int] = None,
     ) -> str:
         """Build the BATCH mode AppleScript for get_tasks.
 
         Uses 'a reference to' for O(P) batch property reads.
+        Notes are truncated to note_limit characters when given.
         Returns the complete AppleScript string.
         """
+        note_truncation = self._note_truncation_block("taskNote", note_limit)
         completion_check_batch = filter_checks['completion_check_batch']
         flagged_check_batch = filter_checks['flagged_check_batch']
         dropped_check_batch = filter_checks['dropped_check_batch']
@@ -3311,11 +3412,14 @@ class OmniFocusConnector:
                         set containerActive to (not effComp) and (not effDrop)
                         set taskAvailable to (directlyAvailable or (numAvailableTasks > 0)) and containerActive
 
+                        set taskNote to item i of taskNotes
+                        {note_truncation}
+
                         -- Build JSON
                         set jsonLine to "{{" & ¬
                             "\\"id\\": \\"" & item i of ids & "\\", " & ¬
                             "\\"name\\": \\"" & my escapeJSON(item i of taskNames) & "\\", " & ¬
-                            "\\"note\\": \\"" & my escapeJSON(item i of taskNotes) & "\\", " & ¬
+                            "\\"note\\": \\"" & my escapeJSON(taskNote) & "\\", " & ¬
                             "\\"completed\\": " & (taskCompleted as text) & ", " & ¬
                             "\\"flagged\\": " & (item i of taskFlags as text) & ", " & ¬
                             "\\"dropped\\": " & (taskDropped as text) & ", " & ¬
@@ -3370,6 +3474,7 @@ class OmniFocusConnector:
         task_id: Optional[str] = None,  # NEW (Phase 3.1): Filter to specific task
         parent_task_id: Optional[str] = None,  # NEW (Phase 3.1): Filter by parent
         include_full_notes: bool = False,  # NEW (Phase 3.1): Return full notes
+        note_limit: Optional[int] = None,
         project_id: Optional[str] = None,
         include_completed: bool = False,
         flagged_only: bool = False,
@@ -3418,6 +3523,8 @@ class OmniFocusConnector:
             task_id: NEW (Phase 3.1): Filter to specific task by ID (consolidates get_task())
             parent_task_id: NEW (Phase 3.1): Filter to subtasks of specific parent (consolidates get_subtasks())
             include_full_notes: NEW (Phase 3.1): Return full note content instead of truncated (consolidates get_note())
+            note_limit: Truncate notes to this many characters (plus "...") inside AppleScript,
+                after query matching, so long notes never cross the pipe. None returns full notes (default: None)
             project_id: Optional project ID to filter tasks. If None, returns all tasks (ignored if inbox_only=True).
             include_completed: Whether to include completed tasks (default: False)
             flagged_only: Only return flagged tasks (default: False)
@@ -3542,13 +3649,13 @@ class OmniFocusConnector:
 
         # Always use batch mode — 'a reference to' works with all source types
         script = self._build_batch_mode_script(
-            task_source, on_hold_tags_decl, filter_checks
+            task_source, on_hold_tags_decl, filter_checks, note_limit=note_limit
         )
 
         try:
             result = run_applescript_read(script, timeout=timeout)
             if result:
-                tasks = json.loads(result)
+                tasks = _json_loads(result)
 
                 return self._post_process_tasks(
                     tasks,
@@ -3929,9 +4036,6 @@ class OmniFocusConnector:
             - OmniFocus errors (task not found, etc.) → Returns dict with success=False
             - Never raises exceptions for runtime OmniFocus errors
         """
-        # SAFETY: Verify database before modifying
-        self._verify_database_safety('update_task')
-
         # Validate parameters
         task_name, status = self._validate_update_task_params(
             task_id=task_id, task_name=task_name,
@@ -3945,6 +4049,9 @@ class OmniFocusConnector:
             recurrence=recurrence,
         )
 
+        # SAFETY: Verify database before modifying
+        self._verify_database_safety('update_task')
+
         # Build AppleScript properties and commands
         properties, separate_commands, updated_fields, _recurrence_js_needed = \
             self._build_update_task_commands(
@@ -4127,13 +4234,29 @@ class OmniFocusConnector:
         tags: Optional[list[str]],
         add_tags: Optional[list[str]],
         remove_tags: Optional[list[str]],
-    ) -> tuple[list[str], bool]:
+    ) -> tuple[list[str], list[str], bool]:
         """Build per-task repeat-loop commands for update_tasks.
 
-        Returns (per_task_commands, has_per_task).
+        Tag names are resolved once in lookup commands that run before the
+        loop, so each task only adds/removes already-resolved tag objects
+        instead of searching flattened tags again. A tag that is not found
+        fails every task that uses it, as an in-loop lookup would.
+
+        Returns (tag_lookup_commands, per_task_commands, has_per_task).
         """
+        tag_lookup_commands: list[str] = []
         per_task_commands: list[str] = []
 
+        def resolve_tag(var_name: str, tag: str) -> str:
+            tag_escaped = self._escape_applescript_string(tag)
+            tag_lookup_commands.append(f'''
+                set {var_name} to missing value
+                try
+                    set {var_name} to first flattened tag whose name is "{tag_escaped}"
+                end try''')
+            return f'''
+                    if {var_name} is missing value then error "Tag not found"'''
+
         if completed is False:
             per_task_commands.append("set completed of theTask to false")
 
@@ -4168,11 +4291,10 @@ class OmniFocusConnector:
         if tags is not None:
             if len(tags) > 0:
                 tag_adds = []
-                for tag in tags:
-                    tag_escaped = self._escape_applescript_string(tag)
-                    tag_adds.append(f'''
-                        set tagObj to first flattened tag whose name is "{tag_escaped}"
-                        copy tagObj to end of newTags''')
+                for i, tag in enumerate(tags, 1):
+                    check = resolve_tag(f"setTag{i}", tag)
+                    tag_adds.append(f'''{check}
+                        copy setTag{i} to end of newTags''')
                 tag_adds_str = "\n                    ".join(tag_adds)
                 per_task_commands.append(f'''
                     set newTags to {{}}
@@ -4182,20 +4304,18 @@ class OmniFocusConnector:
                 per_task_commands.append("set tags of theTask to {}")
 
         if add_tags is not None:
-            for tag in add_tags:
-                tag_escaped = self._escape_applescript_string(tag)
-                per_task_commands.append(f'''
-                    set tagObj to first flattened tag whose name is "{tag_escaped}"
-                    add tagObj to tags of theTask''')
+            for i, tag in enumerate(add_tags, 1):
+                check = resolve_tag(f"addTag{i}", tag)
+                per_task_commands.append(f'''{check}
+                    add addTag{i} to tags of theTask''')
 
         if remove_tags is not None:
-            for tag in remove_tags:
-                tag_escaped = self._escape_applescript_string(tag)
-                per_task_commands.append(f'''
-                    set tagObj to first flattened tag whose name is "{tag_escaped}"
-                    remove tagObj from tags of theTask''')
+            for i, tag in enumerate(remove_tags, 1):
+                check = resolve_tag(f"removeTag{i}", tag)
+                per_task_commands.append(f'''{check}
+                    remove removeTag{i} from tags of theTask''')
 
-        return per_task_commands, len(per_task_commands) > 0
+        return tag_lookup_commands, per_task_commands, len(per_task_commands) > 0
 
     def update_tasks(
         self,
@@ -4247,11 +4367,6 @@ class OmniFocusConnector:
                 "failures": list[dict] with "task_id" and "error"
             }
 
-        Note:
-            ``updated_ids`` is approximate on partial failure — it lists
-            the first N IDs from the input, not necessarily the ones that
-            succeeded.
-
         Raises:
             ValueError: If validation fails (task_name/note provided, conflicting params, etc.)
 
@@ -4263,9 +4378,6 @@ class OmniFocusConnector:
             )
             # Returns: {"updated_count": 3, "failed_count": 0, "updated_ids": [...], "failures": []}
         """
-        # SAFETY: Verify database before modifying
-        self._verify_database_safety('update_tasks')
-
         # Validate and normalize parameters
         ids_list = self._validate_update_tasks_params(
             task_ids=task_ids, flagged=flagged, sequential=sequential,
@@ -4276,6 +4388,9 @@ class OmniFocusConnector:
             kwargs=kwargs,
         )
 
+        # SAFETY: Verify database before modifying
+        self._verify_database_safety('update_tasks')
+
         or_chain_target = self._build_whose_or_chain(ids_list, "flattened task")
 
         # Build bulk-settable and per-task commands
@@ -4286,7 +4401,7 @@ class OmniFocusConnector:
             completed=completed,
         )
 
-        per_task_commands, has_per_task = self._build_per_task_update_commands(
+        tag_lookup_commands, per_task_commands, has_per_task = self._build_per_task_update_commands(
             completed=completed, status=status, project_id=project_id,
             parent_task_id=parent_task_id, tags=tags, add_tags=add_tags,
             remove_tags=remove_tags,
@@ -4304,9 +4419,15 @@ class OmniFocusConnector:
                 [f'"{self._escape_applescript_string(tid)}"' for tid in ids_list]
             )
             per_task_cmds_str = "\n                        ".join(per_task_commands)
+            tag_lookup_str = "\n                ".join(tag_lookup_commands)
             per_task_block = f'''
+                {tag_lookup_str}
                 set taskIdList to {{{ids_applescript}}}
                 set successCount to 0
+                set failedIds to {{}}
+                -- Suspend autosave so OmniFocus saves once, not after every item
+                set previousAutosave to will autosave
+                set will autosave to false
 
                 repeat with taskId in taskIdList
                     try
@@ -4314,19 +4435,29 @@ class OmniFocusConnector:
                         {per_task_cmds_str}
                         set successCount to successCount + 1
                     on error
-                        -- Task not found or update failed, skip
+                        -- Task not found or update failed: report it, continue
+                        set end of failedIds to (contents of taskId)
                     end try
-                end repeat'''
+                end repeat
+                set will autosave to previousAutosave'''
 
-        # Count: bulk uses pre-counted value, per-task uses successCount
+        # Result: bulk-only reports IDs the whose-chain did not match (one
+        # Apple Event for the found IDs); per-task loops record their failures
         if has_bulk and not has_per_task:
-            count_expr = f"count of ({or_chain_target})"
+            ids_applescript = ", ".join(
+                [f'"{self._escape_applescript_string(tid)}"' for tid in ids_list]
+            )
             script = f'''
         tell application "OmniFocus"
             tell front document
-                set preCount to ({count_expr})
+                set foundIds to id of ({or_chain_target})
                 {bulk_block}
-                return preCount as text
+                set successCount to count of foundIds
+                set failedIds to {{}}
+                repeat with taskId in {{{ids_applescript}}}
+                    if foundIds does not contain (contents of taskId) then set end of failedIds to (contents of taskId)
+                end repeat
+                {self._BATCH_RESULT_RETURN}
             end tell
         end tell
         '''
@@ -4335,40 +4466,38 @@ class OmniFocusConnector:
         tell application "OmniFocus"
             tell front document
                 {per_task_block}
-                return successCount as text
+                {self._BATCH_RESULT_RETURN}
             end tell
         end tell
         '''
         else:
             # Hybrid: bulk commands first, then repeat loop
-            count_expr = f"count of ({or_chain_target})"
             script = f'''
         tell application "OmniFocus"
             tell front document
                 {bulk_block}
                 {per_task_block}
-                return successCount as text
+                {self._BATCH_RESULT_RETURN}
             end tell
         end tell
         '''
 
         try:
-            result = run_applescript(script)
-            updated_count = int(result.strip())
-            total_count = len(ids_list)
-            failed_count = total_count - updated_count
-
-            # Build list of updated IDs (AppleScript doesn't track which specific ones failed)
-            updated_ids = ids_list[:updated_count] if updated_count > 0 else []
+            result = self._run_batch_script(script)
+            updated_count, updated_ids, failures = self._parse_batch_result(
+                result, ids_list, "task_id", "Task not found or update failed"
+            )
 
             return {
                 "updated_count": updated_count,
-                "failed_count": failed_count,
+                "failed_count": len(ids_list) - updated_count,
                 "updated_ids": updated_ids,
-                "failures": []  # Batch AppleScript doesn't provide per-task failure detail
+                "failures": failures,
             }
         except subprocess.CalledProcessError as e:
             raise Exception(f"Error batch updating tasks: {e.stderr}")
+        except ValueError as e:
+            raise Exception(f"Error parsing update result: {e}")
 
 
     def _get_tag_exclusivity_map(self) -> dict[str, bool]:
@@ -4393,7 +4522,7 @@ class OmniFocusConnector:
             'end tell'
         )
         result = run_applescript(js_script)
-        return json.loads(result)
+        return _json_loads(result)
 
     def _set_tag_exclusivity(self, tag_id: str, value: bool) -> None:
         """Set childrenAreMutuallyExclusive on a tag via OmniAutomation.
@@ -4478,7 +4607,7 @@ class OmniFocusConnector:
         try:
             result = run_applescript_read(script)
             if result:
-                tags = json.loads(result)
+                tags = _json_loads(result)
             else:
                 tags = []
 
@@ -4715,7 +4844,7 @@ class OmniFocusConnector:
                     raise Exception(
                         f"Error updating tag: {result[len('ERROR:'):]}"
                     )
-                parsed = json.loads(result)
+                parsed = _json_loads(result)
             except json.JSONDecodeError:
                 raise Exception(
                     f"Error parsing update tag result: {result}"
@@ -4737,6 +4866,71 @@ class OmniFocusConnector:
         parsed["error"] = None
         return parsed
 
+    def set_autosave(self, enabled: bool) -> bool:
+        """Turn OmniFocus document autosave on or off.
+
+        OmniFocus saves after every mutation while autosave is on, which
+        dominates the cost of multi-item writes. Callers disable it around a
+        batch and restore the previous value afterwards; re-enabling also
+        requests one sync so the whole batch is pushed at once.
+
+        Args:
+            enabled: New autosave setting
+
+        Returns:
+            bool: The previous autosave setting (to restore later)
+        """
+        sync_step = ""
+        if enabled:
+            sync_step = """
+                try
+                    synchronize
+                end try"""
+
+        script = f'''
+        tell application "OmniFocus"
+            tell front document
+                set previousAutosave to will autosave
+                set will autosave to {"true" if enabled else "false"}{sync_step}
+                return previousAutosave as text
+            end tell
+        end tell
+        '''
+
+        try:
+            return run_applescript(script).strip() == "true"
+        except subprocess.CalledProcessError as e:
+            raise Exception(f"Error setting autosave: {e.stderr}")
+
+    def restore_autosave(self) -> bool:
+        """Turn autosave back on if an interrupted batch left it off.
+
+        A process killed between set_autosave(False) and set_autosave(True)
+        leaves OmniFocus not saving. Does nothing, and does not launch
+        OmniFocus, if the app is not running.
+
+        Returns:
+            bool: True if autosave was off and has been re-enabled
+        """
+        script = """
+        if application "OmniFocus" is running then
+            tell application "OmniFocus"
+                tell front document
+                    if not will autosave then
+                        set will autosave to true
+                        return "restored"
+                    end if
+                end tell
+            end tell
+        end if
+        return "unchanged"
+        """
+
+        try:
+            return run_applescript(script).strip() == "restored"
+        except subprocess.CalledProcessError as e:
+            raise Exception(f"Error restoring autosave: {e.stderr}")
+
     def delete_tags(self, tag_ids: Union[str, list[str]]) -> dict:
         """Delete one or more tags from OmniFocus.
 
@@ -4755,8 +4949,6 @@ class OmniFocusConnector:
             ValueError: If tag_ids is empty
             Exception: If the operation fails
         """
-        self._verify_database_safety('delete_tags')
-
         if isinstance(tag_ids, str):
             ids_list_input = [tag_ids]
         else:
@@ -4765,6 +4957,8 @@ class OmniFocusConnector:
         if not ids_list_input:
             raise ValueError("tag_ids cannot be empty")
 
+        self._verify_database_safety('delete_tags')
+
         ids_list = ", ".join([f'"{self._escape_applescript_string(tid)}"' for tid in ids_list_input])
 
         script = f'''
@@ -4772,6 +4966,10 @@ class OmniFocusConnector:
             tell front document
                 set tagIdList to {{{ids_list}}}
                 set successCount to 0
+                set failedIds to {{}}
+                -- Suspend autosave so OmniFocus saves once, not after every item
+                set previousAutosave to will autosave
+                set will autosave to false
 
                 repeat with tagId in tagIdList
                     try
@@ -4779,27 +4977,27 @@ class OmniFocusConnector:
                         delete theTag
                         set successCount to successCount + 1
                     on error
-                        -- Tag not found, skip
+                        -- Tag not found or delete failed: report it, continue
+                        set end of failedIds to (contents of tagId)
                     end try
                 end repeat
-
-                return successCount as text
+                set will autosave to previousAutosave
+{self._BATCH_RESULT_RETURN}
             end tell
         end tell
         '''
 
         try:
-            result = run_applescript(script)
-            deleted_count = int(result.strip())
-            total_count = len(ids_list_input)
-            failed_count = total_count - deleted_count
-            deleted_ids = ids_list_input[:deleted_count] if deleted_count > 0 else []
+            result = self._run_batch_script(script)
+            deleted_count, deleted_ids, failures = self._parse_batch_result(
+                result, ids_list_input, "tag_id", "Tag not found or delete failed"
+            )
 
             return {
                 "deleted_count": deleted_count,
-                "failed_count": failed_count,
+                "failed_count": len(ids_list_input) - deleted_count,
                 "deleted_ids": deleted_ids,
-                "failures": []
+                "failures": failures
             }
         except subprocess.CalledProcessError as e:
             raise Exception(f"Error deleting tags: {e.stderr}")
@@ -4819,7 +5017,7 @@ class OmniFocusConnector:
                 "deleted_count": int,
                 "failed_count": int,
                 "deleted_ids": list[str],
-                "failures": list[dict]  # Empty for now (AppleScript doesn't track individual failures)
+                "failures": list[dict]  # {"task_id", "error"} per failed ID
             }
 
         Raises:
@@ -4830,9 +5028,6 @@ class OmniFocusConnector:
             result = client.delete_tasks(["task-001", "task-002"])
             # Returns: {"deleted_count": 2, "failed_count": 0, "deleted_ids": [...], "failures": []}
         """
-        # SAFETY: Verify database before modifying
-        self._verify_database_safety('delete_tasks')
-
         # Normalize task_ids to list
         if isinstance(task_ids, str):
             ids_list_input = [task_ids]
@@ -4843,6 +5038,9 @@ class OmniFocusConnector:
         if not ids_list_input:
             raise ValueError("task_ids cannot be empty")
 
+        # SAFETY: Verify database before modifying
+        self._verify_database_safety('delete_tasks')
+
         # Build AppleScript list of task IDs
         ids_list = ", ".join([f'"{self._escape_applescript_string(task_id)}"' for task_id in ids_list_input])
 
@@ -4851,6 +5049,10 @@ class OmniFocusConnector:
             tell front document
                 set taskIdList to {{{ids_list}}}
                 set successCount to 0
+                set failedIds to {{}}
+                -- Suspend autosave so OmniFocus saves once, not after every item
+                set previousAutosave to will autosave
+                set will autosave to false
 
                 repeat with taskId in taskIdList
                     try
@@ -4858,31 +5060,27 @@ class OmniFocusConnector:
                         delete theTask
                         set successCount to successCount + 1
                     on error
-                        -- Task not found, skip
+                        -- Task not found or delete failed: report it, continue
+                        set end of failedIds to (contents of taskId)
                     end try
                 end repeat
-
-                return successCount as text
+                set will autosave to previousAutosave
+{self._BATCH_RESULT_RETURN}
             end tell
         end tell
         '''
 
         try:
-            result = run_applescript(script)
-            deleted_count = int(result.strip())
-            total_count = len(ids_list_input)
-            failed_count = total_count - deleted_count
-
-            # Build list of deleted IDs (we successfully deleted the first N tasks)
-            # Note: AppleScript doesn't tell us which specific tasks failed,
-            # so we assume the first deleted_count tasks succeeded
-            deleted_ids = ids_list_input[:deleted_count] if deleted_count > 0 else []
+            result = self._run_batch_script(script)
+            deleted_count, deleted_ids, failures = self._parse_batch_result(
+                result, ids_list_input, "task_id", "Task not found or delete failed"
+            )
 
             return {
                 "deleted_count": deleted_count,
-                "failed_count": failed_count,
+                "failed_count": len(ids_list_input) - deleted_count,
                 "deleted_ids": deleted_ids,
-                "failures": []  # AppleScript doesn't provide detailed failure info
+                "failures": failures
             }
         except subprocess.CalledProcessError as e:
             raise Exception(f"Error deleting tasks: {e.stderr}")
@@ -4912,9 +5110,6 @@ class OmniFocusConnector:
             ValueError: If project_ids is empty
             Exception: If the operation fails completely
         """
-        # SAFETY: Verify database before modifying
-        self._verify_database_safety('delete_projects')
-
         # Normalize project_ids to list
         if isinstance(project_ids, str):
             ids_list_data = [project_ids]
@@ -4924,6 +5119,9 @@ class OmniFocusConnector:
         if not ids_list_data:
             raise ValueError("project_ids cannot be empty")
 
+        # SAFETY: Verify database before modifying
+        self._verify_database_safety('delete_projects')
+
         # Build AppleScript list of project IDs
         ids_list = ", ".join([f'"{self._escape_applescript_string(project_id)}"' for project_id in ids_list_data])
 
@@ -4932,6 +5130,10 @@ class OmniFocusConnector:
             tell front document
                 set projectIdList to {{{ids_list}}}
                 set successCount to 0
+                set failedIds to {{}}
+                -- Suspend autosave so OmniFocus saves once, not after every item
+                set previousAutosave to will autosave
+                set will autosave to false
 
                 repeat with projectId in projectIdList
                     try
@@ -4939,26 +5141,28 @@ class OmniFocusConnector:
                         delete theProject
                         set successCount to successCount + 1
                     on error
-                        -- Project not found, skip
+                        -- Project not found or delete failed: report it, continue
+                        set end of failedIds to (contents of projectId)
                     end try
                 end repeat
-
-                return successCount as text
+                set will autosave to previousAutosave
+{self._BATCH_RESULT_RETURN}
             end tell
         end tell
         '''
 
         try:
-            result = run_applescript(script)
-            deleted_count = int(result.strip())
-            failed_count = len(ids_list_data) - deleted_count
+            result = self._run_batch_script(script)
+            deleted_count, deleted_ids, failures = self._parse_batch_result(
+                result, ids_list_data, "project_id", "Project not found or delete failed"
+            )
 
             # Return dict format for consistency with update_projects()
             return {
                 "deleted_count": deleted_count,
-                "failed_count": failed_count,
-                "deleted_ids": ids_list_data[:deleted_count],  # Assume first N succeeded
-                "failures": []  # AppleScript doesn't track individual failures
+                "failed_count": len(ids_list_data) - deleted_count,
+                "deleted_ids": deleted_ids,
+                "failures": failures
             }
         except subprocess.CalledProcessError as e:
             raise Exception(f"Error deleting projects: {e.stderr}")
@@ -5035,7 +5239,7 @@ class OmniFocusConnector:
 
         try:
             result = run_applescript_read(script)
-            folders = json.loads(result)
+            folders = _json_loads(result)
             for folder in folders:
                 folder["status"] = "dropped" if folder.get("hidden") else "active"
             return folders
@@ -5218,15 +5422,15 @@ class OmniFocusConnector:
             ValueError: If neither or both before_task_id and after_task_id are provided
             Exception: If tasks not found, not in same project, or operation fails
         """
-        # SAFETY: Verify database before modifying
-        self._verify_database_safety('reorder_task')
-
         # Validate parameters
         if before_task_id is None and after_task_id is None:
             raise ValueError("Must provide either before_task_id or after_task_id")
         if before_task_id is not None and after_task_id is not None:
             raise ValueError("Cannot provide both before_task_id and after_task_id")
 
+        # SAFETY: Verify database before modifying
+        self._verify_database_safety('reorder_task')
+
         reference_task_id = before_task_id if before_task_id else after_task_id
         position = "before" if before_task_id else "after"
 
@@ -5275,9 +5479,6 @@ class OmniFocusConnector:
             ValueError: If project_id is empty, or neither/both reference IDs provided
             Exception: If projects not found, not in same folder, or operation fails
         """
-        # SAFETY: Verify database before modifying
-        self._verify_database_safety('reorder_project')
-
         if not project_id:
             raise ValueError("project_id is required")
 
@@ -5287,6 +5488,9 @@ class OmniFocusConnector:
         if before_project_id is not None and after_project_id is not None:
             raise ValueError("Cannot provide both before_project_id and after_project_id")
 
+        # SAFETY: Verify database before modifying
+        self._verify_database_safety('reorder_project')
+
         reference_project_id = before_project_id if before_project_id else after_project_id
         position = "before" if before_project_id else "after"
 
@@ -5402,7 +5606,7 @@ class OmniFocusConnector:
 
         try:
             result = run_applescript_read(script)
-            return json.loads(result)
+            return _json_loads(result)
         except subprocess.CalledProcessError as e:
             raise Exception(f"Error retrieving perspectives: {e.stderr}")
 
@@ -5622,6 +5826,6 @@ class OmniFocusConnector:
 
         try:
             result = run_applescript_read(script)
-            return json.loads(result)
+            return _json_loads(result)
         except subprocess.CalledProcessError as e:
             raise Exception(f"Error getting focus: {e.stderr}")
@@ -1,13 +1,25 @@
 #!/usr/bin/env python3
 """FastMCP Server for OmniFocus integration."""
+import asyncio
+import contextlib
+import functools
+import json
+import logging
 import os
-from typing import Optional, Union
+import sys
+import threading
+import time
+import weakref
+from datetime import date, timedelta
+from typing import Awaitable, Callable, Optional, Union
 
 from fastmcp import FastMCP
 from pydantic import BaseModel
 
 from .omnifocus_connector import OmniFocusConnector
 
+logger = logging.getLogger(__name__)
+
 # Create FastMCP server
 mcp = FastMCP("omnifocus-mcp", instructions="""OmniFocus is a GTD task manager. Hierarchy: Folders > Projects > Tasks > Subtasks.
 
@@ -28,21 +40,395 @@ TAGS: Represent work contexts. Tag statuses: Active (normal), On Hold (tasks exc
 DEFER vs DUE: Defer = hidden until that date. Due = deadline.
 """)
 
+# In-flight read calls, keyed by tool name + arguments + cache generation (see _tool)
+_inflight: dict[str, asyncio.Future] = {}
+
+
+async def _single_flight(key: str, run: Callable[[], Awaitable[str]]) -> str:
+    """Run a read at most once per key; concurrent identical callers share it.
+
+    The first caller for a key starts ``run()`` as a task of its own; it and
+    callers that arrive while the task is in flight all await it instead of
+    spawning another osascript process. Cancelling any caller, the first one
+    included, leaves the task running for the others. The key is released as
+    soon as the task settles, so this only coalesces overlapping calls -- it
+    is not a cache.
+    """
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(run())
+        _inflight[key] = task
+
+        def release(done: asyncio.Future) -> None:
+            if _inflight.get(key) is done:
+                del _inflight[key]
+            if not done.cancelled():
+                done.exception()  # Mark retrieved if every caller was cancelled
+
+        task.add_done_callback(release)
+    return await asyncio.shield(task)
+
+
+# Short-lived results of cached read tools, keyed like _inflight (see _tool)
+READ_CACHE_TTL_SECONDS = 2.0
+READ_CACHE_MAX_ENTRIES = 64
+_read_cache: dict[str, tuple[float, str]] = {}
+_read_cache_generation = 0
+
+
+def _read_cache_get(key: str) -> Optional[str]:
+    """Return a cached read result if it is younger than the TTL."""
+    entry = _read_cache.get(key)
+    if entry is None:
+        return None
+    stored_at, result = entry
+    if time.monotonic() - stored_at >= READ_CACHE_TTL_SECONDS:
+        del _read_cache[key]
+        return None
+    return result
+
+
+def _read_cache_put(key: str, result: str, generation: int) -> None:
+    """Store a read result unless a write happened since the read started."""
+    if generation != _read_cache_generation or result.startswith("Error"):
+        return
+    if len(_read_cache) >= READ_CACHE_MAX_ENTRIES:
+        del _read_cache[next(iter(_read_cache))]  # Oldest insertion
+    _read_cache[key] = (time.monotonic(), result)
+
+
+def _invalidate_read_cache(tools: Optional[tuple[str, ...]] = None) -> None:
+    """Drop cached reads after a write; ``tools`` limits it to those tools.
+
+    The generation bump applies regardless, so no read that was in flight
+    during the write stores its result.
+    """
+    global _read_cache_generation
+    _read_cache_generation += 1
+    if tools is None:
+        _read_cache.clear()
+        return
+    prefixes = tuple(f"{tool}:" for tool in tools)
+    for key in [k for k in _read_cache if k.startswith(prefixes)]:
+        del _read_cache[key]
+
+
+# Cached read tools each kind of write can change (see _tool). get_projects
+# shows task health, tags and folder paths, so every data write affects it;
+# window/focus changes affect none.
+_AFFECTS_PROJECTS = ("get_projects",)
+_AFFECTS_TAGS = ("get_tags", "get_projects")
+_AFFECTS_FOLDERS = ("get_folders", "get_projects")
+
+# Held by write tools while they run (see _tool). An asyncio.Lock only works
+# on the event loop it is first used on, so each loop gets its own.
+_write_locks: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+async def _run_serialized(
+    invalidates: Optional[tuple[str, ...]], fn: Callable[..., str], *args, **kwargs
+) -> str:
+    """Run a write tool in a worker thread, one write at a time.
+
+    The lock is awaited on the event loop, so queued writes do not occupy
+    executor threads that reads need. It is released, and the affected cached
+    reads invalidated, only once the worker thread finishes -- even if the
+    caller is cancelled -- so writes never overlap.
+    """
+    loop = asyncio.get_running_loop()
+    lock = _write_locks.setdefault(loop, asyncio.Lock())
+    await lock.acquire()
+    write = asyncio.ensure_future(asyncio.to_thread(fn, *args, **kwargs))
+
+    def finish(done: asyncio.Future) -> None:
+        _invalidate_read_cache(invalidates)
+        lock.release()
+        if not done.cancelled():
+            done.exception()  # Mark retrieved if the caller was cancelled
+
+    write.add_done_callback(finish)
+    return await asyncio.shield(write)
+
+
+def _tool(
+    single_flight: bool = False,
+    cache: bool = False,
+    invalidates: Optional[tuple[str, ...]] = None,
+):
+    """Register a sync tool function with FastMCP, executed off the event loop.
+
+    Every tool blocks on an osascript subprocess for tens of milliseconds to
+    several seconds. Registering the sync function directly would run it on
+    the stdio event loop and serialize concurrent tool calls, so FastMCP is
+    handed an async shim that runs the tool in a worker thread instead.
+
+    The undecorated sync function is returned, so tools remain plain callables
+    for direct Python use (tests, deprecated single-item wrappers).
+
+    Tools without ``single_flight`` are treated as writes. They run one at a
+    time (see _run_serialized), so concurrent batches do not interleave their
+    item loops or autosave toggles, while reads keep overlapping freely. Once a write
+    finishes (successfully or not), the cached results of the read tools it
+    can affect are discarded.
+
+    Args:
+        single_flight: Coalesce concurrent calls with identical arguments into
+            one execution. Only safe for idempotent read tools.
+        cache: Also reuse the result of an identical call for
+            READ_CACHE_TTL_SECONDS. Requires ``single_flight``; changes made
+            in the OmniFocus app itself may be missed for that long.
+        invalidates: Names of the cached read tools whose output a write tool
+            can change (None: all of them).
+    """
+    def decorator(fn: Callable[..., str]) -> Callable[..., str]:
+        @functools.wraps(fn)
+        async def run_in_thread(*args, **kwargs) -> str:
+            if not single_flight:
+                return await _run_serialized(invalidates, fn, *args, **kwargs)
+
+            key = f"{fn.__name__}:{args!r}:{sorted(kwargs.items())!r}"
+            if cache:
+                cached = _read_cache_get(key)
+                if cached is not None:
+                    return cached
+            # A read started before the latest write must not serve callers
+            # that arrive after it, so the generation is part of the key
+            generation = _read_cache_generation
+            result = await _single_flight(
+                f"{key}:{generation}", lambda: asyncio.to_thread(fn, *args, **kwargs)
+            )
+            if cache:
+                _read_cache_put(key, result, generation)
+            return result
+
+        mcp.tool()(run_in_thread)
+        return fn
+
+    return decorator
+
+
 # Configuration
 NOTE_TRUNCATION_LENGTH = 100  # Maximum note length in get_projects/get_tasks responses
+LOG_FILE_ENV_VAR = "OMNIFOCUS_MCP_LOG"  # Path to write package logs to (unset: no logging)
+
+
+def _configure_logging() -> None:
+    """Route package logs to the file named by OMNIFOCUS_MCP_LOG, if set.
 
-# Initialize OmniFocus client (lazy)
+    The package logger only carries a NullHandler otherwise, so warnings from
+    the connector are neither formatted nor written during normal operation.
+    Logs go to a file rather than a std stream, which the stdio transport and
+    the hosting MCP client own. A log file that cannot be opened is reported
+    once on stderr and the server runs without file logging.
+    """
+    log_path = os.environ.get(LOG_FILE_ENV_VAR)
+    if not log_path:
+        return
+    package_logger = logging.getLogger("omnifocus_mcp")
+    try:
+        handler = logging.FileHandler(log_path)
+    except OSError as e:
+        print(
+            f"omnifocus-mcp: cannot open {LOG_FILE_ENV_VAR} file {log_path!r} ({e}); "
+            "continuing without file logging",
+            file=sys.stderr,
+        )
+        return
+    handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+    package_logger.addHandler(handler)
+    package_logger.setLevel(logging.INFO)
+
+# Initialize OmniFocus client (lazy, shared by all tool calls)
 _client: Optional[OmniFocusConnector] = None
+_client_lock = threading.Lock()
 
 
 def get_client() -> OmniFocusConnector:
-    """Get or create the OmniFocus client."""
+    """Get or create the OmniFocus client.
+
+    Tools run in worker threads, so first-time creation is locked to keep a
+    single shared client; once created, calls return it without locking.
+    """
     global _client
-    if _client is None:
-        # Disable safety checks if in pytest environment (for integration tests with mocked AppleScript)
-        _in_pytest = os.environ.get('PYTEST_CURRENT_TEST') is not None
-        _client = OmniFocusConnector(enable_safety_checks=not _in_pytest)
-    return _client
+    client = _client
+    if client is not None:
+        return client
+    with _client_lock:
+        if _client is None:
+            # Disable safety checks if in pytest environment (for integration tests with mocked AppleScript)
+            _in_pytest = os.environ.get('PYTEST_CURRENT_TEST') is not None
+            _client = OmniFocusConnector(enable_safety_checks=not _in_pytest)
+        return _client
+
+
+@contextlib.contextmanager
+def _autosave_suspended(client: OmniFocusConnector, item_count: int):
+    """Suspend OmniFocus autosave while a multi-item write loop runs.
+
+    Batch tools issue one osascript call per item, and OmniFocus saves after
+    each of them. Single-item calls skip the two extra round-trips. Failing to
+    toggle autosave never fails the batch itself. If the server is killed
+    mid-batch, main() turns autosave back on at the next start.
+    """
+    if item_count < 2:
+        yield
+        return
+    try:
+        previous = client.set_autosave(False)
+    except Exception as e:
+        logger.warning("Could not disable OmniFocus autosave: %s", e)
+        yield
+        return
+    try:
+        yield
+    finally:
+        if previous:
+            try:
+                client.set_autosave(True)
+            except Exception as e:
+                logger.warning("Could not re-enable OmniFocus autosave: %s", e)
+
+
+# Update fields whose connector batch form is one "set <property> of (<id
+# whose-chain>)" Apple Event. Batch field tuples list fields in the order the
+# single-item method reports them in updated_fields, so batched and per-item
+# results read the same.
+_PROJECT_BATCH_FIELDS = (
+    "sequential", "due_date", "defer_date", "planned_date", "flagged", "estimated_minutes",
+)
+
+# update_tasks also batches moves, drops and tag deltas: its per-task loop runs
+# the same commands as update_task, once per ID, inside one script. Full tag
+# replacement stays per item (update_tasks uses "set tags of theTask", which
+# update_task avoids), as does "completed", which spawns a new occurrence for
+# repeating tasks.
+_TASK_BATCH_FIELDS = (
+    "flagged", "sequential", "due_date", "defer_date", "planned_date", "estimated_minutes",
+    "status", "project_id", "parent_task_id", "add_tags", "remove_tags",
+)
+
+
+def _batch_key(fields: dict) -> tuple:
+    """Hashable grouping key for an update's fields (lists become tuples)."""
+    return tuple(
+        (k, tuple(v) if isinstance(v, list) else v) for k, v in sorted(fields.items())
+    )
+
+
+def _apply_batch(
+    ids: list[str],
+    fields: dict,
+    updated_fields: list[str],
+    update_many: Callable[..., dict],
+    id_key: str,
+) -> Optional[dict[str, dict]]:
+    """Run one ``update_many`` call and return a result dict per ID.
+
+    Returns None if the connector rejected the arguments (ValueError is raised
+    before any script runs), so the caller can apply the items one by one and
+    report each validation error against its ID.
+    """
+    try:
+        batch = update_many(ids, **fields)
+    except ValueError as e:
+        logger.warning("Batch update of %d items rejected, applying one by one: %s", len(ids), e)
+        return None
+    except Exception as e:
+        logger.exception("Batch update of %d items failed", len(ids))
+        return {
+            item_id: {"id": item_id, "success": False, "updated_fields": [], "error": str(e)}
+            for item_id in ids
+        }
+
+    errors = {f[id_key]: f["error"] for f in batch["failures"]}
+    succeeded = set(batch["updated_ids"])
+    return {
+        item_id: {
+            "id": item_id,
+            "success": item_id in succeeded,
+            "updated_fields": updated_fields if item_id in succeeded else [],
+            "error": None if item_id in succeeded else errors.get(item_id, "Update failed"),
+        }
+        for item_id in ids
+    }
+
+
+def _apply_updates(
+    client: OmniFocusConnector,
+    items: list,
+    update_one: Callable[..., dict],
+    update_many: Callable[..., dict],
+    id_key: str,
+    batch_fields: tuple[str, ...] = _PROJECT_BATCH_FIELDS,
+) -> list[dict]:
+    """Apply update items, batching those that set identical fields.
+
+    Items whose changes are all in ``batch_fields`` and identical to at least
+    one other item's go through a single ``update_many`` call, and each ID is
+    reported from that call's updated_ids/failures. The rest go through one
+    ``update_one`` call per item. Batches run before the per-item calls, so
+    nothing is batched when an ID appears more than once: its updates must
+    apply in input order.
+
+    Args:
+        client: Connector (for autosave suspension around per-item calls)
+        items: TaskUpdate/ProjectUpdate models
+        update_one: Called as update_one(item_id, **fields); returns update_task-style dict
+        update_many: Called as update_many(item_ids, **fields); returns update_tasks-style dict
+        id_key: Key naming the ID in update_many failures ("task_id"/"project_id")
+        batch_fields: Fields update_many applies exactly as update_one would,
+            in update_one's updated_fields order
+
+    Returns:
+        One result dict (id, success, updated_fields, error) per item, in input order
+    """
+    results: list[Optional[dict]] = [None] * len(items)
+    changes = [item.model_dump(exclude_none=True, exclude={"id"}) for item in items]
+
+    groups: dict[tuple, list[int]] = {}
+    if len({item.id for item in items}) == len(items):
+        for i, fields in enumerate(changes):
+            if fields and fields.keys() <= set(batch_fields):
+                groups.setdefault(_batch_key(fields), []).append(i)
+
+    for indexes in groups.values():
+        if len(indexes) < 2:
+            continue
+        fields = changes[indexes[0]]
+        batch = _apply_batch(
+            [items[i].id for i in indexes],
+            fields,
+            [f for f in batch_fields if f in fields],
+            update_many,
+            id_key,
+        )
+        if batch is not None:
+            for i in indexes:
+                results[i] = batch[items[i].id]
+
+    remaining = [i for i, r in enumerate(results) if r is None]
+    with _autosave_suspended(client, len(remaining)):
+        for i in remaining:
+            item = items[i]
+            try:
+                result = update_one(item.id, **changes[i])
+                results[i] = {
+                    "id": item.id,
+                    "success": result["success"],
+                    "updated_fields": result.get("updated_fields", []),
+                    "error": result.get("error"),
+                }
+            except (ValueError, Exception) as e:
+                results[i] = {
+                    "id": item.id,
+                    "success": False,
+                    "updated_fields": [],
+                    "error": str(e),
+                }
+
+    return results
 
 
 def _truncate_note(note: str, max_length: int = NOTE_TRUNCATION_LENGTH) -> str:
@@ -60,6 +446,169 @@ def _truncate_note(note: str, max_length: int = NOTE_TRUNCATION_LENGTH) -> str:
     return note
 
 
+# Table-driven formatting: (key, label) pairs emitted as "label: value" when
+# the value is truthy (or, for membership fields, whenever the key is present).
+# Order matches the display order.
+_TASK_STATUS_LINES = (
+    ('effectivelyCompleted', "Effectively Completed: Yes (parent project/action group is completed)\n"),
+    ('effectivelyDropped', "Effectively Dropped: Yes (parent project/action group is dropped)\n"),
+    ('next', "Next: Yes\n"),
+    ('flagged', "Flagged: Yes\n"),
+    ('inInbox', "In Inbox: Yes\n"),
+)
+_TASK_DATE_FIELDS = (
+    ('dueDate', "Due"),
+    ('deferDate', "Defer"),
+    ('plannedDate', "Planned"),
+    ('nextDueDate', "Next Due"),
+    ('nextDeferDate', "Next Defer"),
+    ('nextPlannedDate', "Next Planned"),
+    ('creationDate', "Created"),
+    ('modificationDate', "Modified"),
+    ('completionDate', "Completed Date"),
+    ('droppedDate', "Dropped Date"),
+)
+_TASK_HIERARCHY_FIELDS = (
+    ('subtaskCount', "Subtask Count"),
+    ('sequential', "Sequential"),
+    ('completedByChildren', "Completed By Children"),
+    ('position', "Position"),
+)
+_PROJECT_DATE_FIELDS = (
+    ('creationDate', "Created"),
+    ('modificationDate', "Modified"),
+    ('completionDate', "Completed Date"),
+    ('droppedDate', "Dropped Date"),
+    ('lastReviewDate', "Last Review"),
+    ('nextReviewDate', "Next Review"),
+)
+
+
+def _expand_on_date(
+    on_name: str, on_val: Optional[str], after_val: Optional[str], before_val: Optional[str]
+) -> tuple[Optional[str], Optional[str], Optional[str]]:
+    """Expand a date _on param to an _after + _before single-day range.
+
+    Returns:
+        (after, before, error) -- error is an "Error: ..." string or None
+    """
+    if on_val is None:
+        return after_val, before_val, None
+    if after_val is not None or before_val is not None:
+        after_name = on_name.replace("_on", "_after")
+        before_name = on_name.replace("_on", "_before")
+        return None, None, f"Error: {on_name} is mutually exclusive with {after_name}/{before_name}."
+    try:
+        d = date.fromisoformat(on_val)
+        return on_val, (d + timedelta(days=1)).isoformat(), None
+    except ValueError:
+        return None, None, f"Error: Invalid date format for {on_name}: '{on_val}'. Use ISO 8601 (e.g., '2026-03-23')."
+
+
+def _paginate(
+    fetch: Callable[[], list], limit: Optional[int], offset: int
+) -> tuple[list, list, str]:
+    """Validate limit/offset, then fetch results and slice one page.
+
+    The page bounds are checked before ``fetch`` runs, so an invalid request
+    costs no AppleScript call.
+
+    Args:
+        fetch: Returns the full, already filtered and sorted result list
+        limit: Maximum number of items to return (None: no limit)
+        offset: Number of leading items to skip
+
+    Returns:
+        (all items, page, header suffix describing the page -- "" when unpaginated)
+
+    Raises:
+        ValueError: If limit is not positive or offset is negative
+    """
+    if limit is not None and limit < 1:
+        raise ValueError(f"limit must be a positive integer, got {limit}.")
+    if offset < 0:
+        raise ValueError(f"offset must be non-negative, got {offset}.")
+    items = fetch()
+    if limit is None and not offset:
+        return items, items, ""
+    end = None if limit is None else offset + limit
+    page = items[offset:end]
+    if not page:
+        return items, page, f" (none at offset {offset})"
+    return items, page, f" (showing {offset + 1}-{offset + len(page)})"
+
+
+RESPONSE_FORMATS = ("text", "json")
+
+
+def _validate_response_format(response_format: str) -> Optional[str]:
+    """Return an error string for an unknown response_format, else None."""
+    if response_format not in RESPONSE_FORMATS:
+        return f"Error: response_format must be 'text' or 'json', got '{response_format}'."
+    return None
+
+
+def _json_response(items: list, page: list, truncate_notes: bool = False) -> str:
+    """Serialize a read result as compact JSON: {"count": total, "items": page}.
+
+    Items are the connector's dicts as-is (same keys as the text output's
+    source), so structured consumers skip both text formatting and parsing.
+    """
+    if truncate_notes:
+        page = [
+            {**item, "note": _truncate_note(item["note"])} if item.get("note") else item
+            for item in page
+        ]
+    return json.dumps(
+        {"count": len(items), "items": page}, separators=(",", ":"), ensure_ascii=False
+    )
+
+
+def _list_response(
+    fetch: Callable[..., list],
+    date_ranges: dict[str, tuple[Optional[str], Optional[str], Optional[str]]],
+    limit: Optional[int],
+    offset: int,
+    response_format: str,
+    truncate_notes: bool,
+    format_text: Callable[[list, list, str], str],
+) -> str:
+    """Run the shared flow of the paginated listing tools (get_tasks, get_projects).
+
+    Each ``<field>_on`` date is expanded to a single-day ``<field>_after`` /
+    ``<field>_before`` range, and response_format and the page are validated,
+    before anything is fetched -- invalid arguments cost no AppleScript call.
+
+    Args:
+        fetch: Called with the expanded date filters as keyword arguments
+        date_ranges: Field prefix ("due", "planned", ...) -> (on, after, before)
+        limit: Maximum number of items to return (None: no limit)
+        offset: Number of leading items to skip
+        response_format: "text" or "json"
+        truncate_notes: Truncate notes in JSON output to preview length
+        format_text: Called as format_text(items, page, page_desc) for text output
+
+    Returns:
+        The formatted page, or an "Error: ..." string
+    """
+    dates = {}
+    for field, (on_val, after_val, before_val) in date_ranges.items():
+        after, before, err = _expand_on_date(f"{field}_on", on_val, after_val, before_val)
+        if err:
+            return err
+        dates[f"{field}_after"], dates[f"{field}_before"] = after, before
+    err = _validate_response_format(response_format)
+    if err:
+        return err
+    try:
+        items, page, page_desc = _paginate(lambda: fetch(**dates), limit, offset)
+    except ValueError as e:
+        return f"Error: {e}"
+    if response_format == "json":
+        return _json_response(items, page, truncate_notes)
+    return format_text(items, page, page_desc)
+
+
 def _format_task(task: dict, truncate_notes: bool = True) -> str:
     """Format a task dictionary as human-readable text.
 
@@ -70,81 +619,54 @@ def _format_task(task: dict, truncate_notes: bool = True) -> str:
     Returns:
         Formatted task text with all properties
     """
-    result = f"ID: {task['id']}\n"
-    result += f"Name: {task['name']}\n"
-    result += f"Project: {task.get('projectName', 'N/A')}\n"
-    result += f"Completed: {task['completed']}\n"
-
-    if task.get('dropped'):
-        result += f"Dropped: Yes\n"
-    if task.get('blocked'):
+    get = task.get
+    parts = [
+        f"ID: {task['id']}\n",
+        f"Name: {task['name']}\n",
+        f"Project: {get('projectName', 'N/A')}\n",
+        f"Completed: {task['completed']}\n",
+    ]
+
+    if get('dropped'):
+        parts.append("Dropped: Yes\n")
+    if get('blocked'):
         # Show blocked status with explanation if it has available subtasks
-        if task.get('numberOfAvailableTasks', 0) > 0:
-            result += f"Blocked: Yes (but has {task['numberOfAvailableTasks']} available subtask(s))\n"
+        if get('numberOfAvailableTasks', 0) > 0:
+            parts.append(f"Blocked: Yes (but has {task['numberOfAvailableTasks']} available subtask(s))\n")
         else:
-            result += f"Blocked: Yes\n"
-    if task.get('available') is not None:
-        result += f"Available: {task['available']}\n"
-    if task.get('effectivelyCompleted'):
-        result += f"Effectively Completed: Yes (parent project/action group is completed)\n"
-    if task.get('effectivelyDropped'):
-        result += f"Effectively Dropped: Yes (parent project/action group is dropped)\n"
-    if task.get('next'):
-        result += f"Next: Yes\n"
-    if task.get('flagged'):
-        result += f"Flagged: Yes\n"
-    if task.get('inInbox'):
-        result += f"In Inbox: Yes\n"
-    if task.get('dueDate'):
-        result += f"Due: {task['dueDate']}\n"
-    if task.get('deferDate'):
-        result += f"Defer: {task['deferDate']}\n"
-    if task.get('plannedDate'):
-        result += f"Planned: {task['plannedDate']}\n"
-    if task.get('nextDueDate'):
-        result += f"Next Due: {task['nextDueDate']}\n"
-    if task.get('nextDeferDate'):
-        result += f"Next Defer: {task['nextDeferDate']}\n"
-    if task.get('nextPlannedDate'):
-        result += f"Next Planned: {task['nextPlannedDate']}\n"
-    if task.get('creationDate'):
-        result += f"Created: {task['creationDate']}\n"
-    if task.get('modificationDate'):
-        result += f"Modified: {task['modificationDate']}\n"
-    if task.get('completionDate'):
-        result += f"Completed Date: {task['completionDate']}\n"
-    if task.get('droppedDate'):
-        result += f"Dropped Date: {task['droppedDate']}\n"
-    if task.get('estimatedMinutes'):
-        result += f"Estimated: {task['estimatedMinutes']} minutes\n"
-    if task.get('repeatSummary'):
-        result += f"Repeats: {task['repeatSummary']}\n"
-    elif task.get('isRecurring'):
-        result += f"Repeats: {task.get('recurrence', 'Yes')}\n"
-    if task.get('catchUpAutomatically') is not None:
-        result += f"Catch Up Automatically: {task['catchUpAutomatically']}\n"
-    if task.get('tags'):
-        result += f"Tags: {task['tags']}\n"
-    if task.get('note'):
+            parts.append("Blocked: Yes\n")
+    if get('available') is not None:
+        parts.append(f"Available: {task['available']}\n")
+    parts.extend(line for key, line in _TASK_STATUS_LINES if get(key))
+    for key, label in _TASK_DATE_FIELDS:
+        value = get(key)
+        if value:
+            parts.append(f"{label}: {value}\n")
+    if get('estimatedMinutes'):
+        parts.append(f"Estimated: {task['estimatedMinutes']} minutes\n")
+    if get('repeatSummary'):
+        parts.append(f"Repeats: {task['repeatSummary']}\n")
+    elif get('isRecurring'):
+        parts.append(f"Repeats: {get('recurrence', 'Yes')}\n")
+    if get('catchUpAutomatically') is not None:
+        parts.append(f"Catch Up Automatically: {task['catchUpAutomatically']}\n")
+    if get('tags'):
+        parts.append(f"Tags: {task['tags']}\n")
+    if get('note'):
         note_text = task['note'] if not truncate_notes else _truncate_note(task['note'])
-        result += f"Note: {note_text}\n"
+        parts.append(f"Note: {note_text}\n")
 
     # Hierarchy fields
     if 'parentTaskId' in task:
         if task['parentTaskId']:
-            result += f"Parent Task ID: {task['parentTaskId']}\n"
+            parts.append(f"Parent Task ID: {task['parentTaskId']}\n")
         else:
-            result += f"Parent Task ID: (none - root level)\n"
-    if 'subtaskCount' in task:
-        result += f"Subtask Count: {task['subtaskCount']}\n"
-    if 'sequential' in task:
-        result += f"Sequential: {task['sequential']}\n"
-    if 'completedByChildren' in task:
-        result += f"Completed By Children: {task['completedByChildren']}\n"
-    if 'position' in task:
-        result += f"Position: {task['position']}\n"
+            parts.append("Parent Task ID: (none - root level)\n")
+    for key, label in _TASK_HIERARCHY_FIELDS:
+        if key in task:
+            parts.append(f"{label}: {task[key]}\n")
 
-    return result
+    return "".join(parts)
 
 
 def _format_project(proj: dict, truncate_notes: bool = True) -> str:
@@ -157,63 +679,114 @@ def _format_project(proj: dict, truncate_notes: bool = True) -> str:
     Returns:
         Formatted project text with all properties
     """
-    result = f"ID: {proj['id']}\n"
-    result += f"Name: {proj['name']}\n"
-    if proj.get('folderPath'):
-        result += f"Folder: {proj['folderPath']}\n"
-    result += f"Status: {proj['status']}\n"
-    if proj.get('flagged'):
-        result += "Flagged: True\n"
+    get = proj.get
+    parts = [f"ID: {proj['id']}\n", f"Name: {proj['name']}\n"]
+    if get('folderPath'):
+        parts.append(f"Folder: {proj['folderPath']}\n")
+    parts.append(f"Status: {proj['status']}\n")
+    if get('flagged'):
+        parts.append("Flagged: True\n")
     if 'sequential' in proj:
-        result += f"Sequential: {proj['sequential']}\n"
-    if proj.get('creationDate'):
-        result += f"Created: {proj['creationDate']}\n"
-    if proj.get('modificationDate'):
-        result += f"Modified: {proj['modificationDate']}\n"
-    if proj.get('completionDate'):
-        result += f"Completed Date: {proj['completionDate']}\n"
-    if proj.get('droppedDate'):
-        result += f"Dropped Date: {proj['droppedDate']}\n"
-    if proj.get('lastReviewDate'):
-        result += f"Last Review: {proj['lastReviewDate']}\n"
-    if proj.get('nextReviewDate'):
-        result += f"Next Review: {proj['nextReviewDate']}\n"
-    if proj.get('reviewIntervalValue') and proj.get('reviewIntervalUnit'):
-        result += f"Review Interval: Every {proj['reviewIntervalValue']} {proj['reviewIntervalUnit']}(s)\n"
-    if proj.get('note'):
+        parts.append(f"Sequential: {proj['sequential']}\n")
+    for key, label in _PROJECT_DATE_FIELDS:
+        value = get(key)
+        if value:
+            parts.append(f"{label}: {value}\n")
+    if get('reviewIntervalValue') and get('reviewIntervalUnit'):
+        parts.append(f"Review Interval: Every {proj['reviewIntervalValue']} {proj['reviewIntervalUnit']}(s)\n")
+    if get('note'):
         note_text = proj['note'] if not truncate_notes else _truncate_note(proj['note'])
-        result += f"Note: {note_text}\n"
+        parts.append(f"Note: {note_text}\n")
 
     # Task health fields (when include_task_health=True)
     if 'remainingCount' in proj:
-        result += f"Remaining Tasks: {proj['remainingCount']}\n"
-        result += f"Available Tasks: {proj['availableCount']}\n"
-        result += f"Overdue Tasks: {proj['overdueCount']}\n"
-        result += f"Deferred Tasks: {proj['deferredCount']}\n"
+        parts.append(f"Remaining Tasks: {proj['remainingCount']}\n")
+        parts.append(f"Available Tasks: {proj['availableCount']}\n")
+        parts.append(f"Overdue Tasks: {proj['overdueCount']}\n")
+        parts.append(f"Deferred Tasks: {proj['deferredCount']}\n")
         # Health status
-        if proj.get('availableCount', 0) > 0:
-            result += "Health: On Track\n"
-        elif proj.get('hasDeferredOnly'):
-            result += "Health: Appropriately Scheduled\n"
-        elif proj.get('remainingCount', 0) == 0:
-            result += "Health: No Remaining Tasks\n"
+        if get('availableCount', 0) > 0:
+            parts.append("Health: On Track\n")
+        elif get('hasDeferredOnly'):
+            parts.append("Health: Appropriately Scheduled\n")
+        elif get('remainingCount', 0) == 0:
+            parts.append("Health: No Remaining Tasks\n")
         else:
-            result += "Health: Stuck\n"
-        if proj.get('stalled'):
-            result += "Stalled: Yes\n"
+            parts.append("Health: Stuck\n")
+        if get('stalled'):
+            parts.append("Stalled: Yes\n")
 
     # Last activity (when include_last_activity=True)
-    if proj.get('lastActivityDate'):
-        result += f"Last Activity: {proj['lastActivityDate']}\n"
+    if get('lastActivityDate'):
+        parts.append(f"Last Activity: {proj['lastActivityDate']}\n")
 
-    return result
+    return "".join(parts)
+
+
+def _format_task_list(
+    tasks: list, page: list, page_desc: str,
+    query: Optional[str], inbox_only: bool, truncate_notes: bool,
+) -> str:
+    """Format a get_tasks result page as text, headed by the total count."""
+    if not tasks:
+        if query:
+            return f"No tasks found matching '{query}'"
+        elif inbox_only:
+            return "No tasks in inbox"
+        return "Found 0 tasks"
+
+    if query and inbox_only:
+        header = f"Found {len(tasks)} inbox tasks matching '{query}'{page_desc}:\n\n"
+    elif query:
+        header = f"Found {len(tasks)} tasks matching '{query}'{page_desc}:\n\n"
+    elif inbox_only:
+        header = f"Found {len(tasks)} inbox tasks{page_desc}:\n\n"
+    else:
+        header = f"Found {len(tasks)} tasks{page_desc}:\n\n"
+    return header + "".join(
+        _format_task(task, truncate_notes) + "\n" for task in page
+    )
+
+
+def _format_project_list(
+    projects: list, page: list, page_desc: str,
+    descriptor: str, query: Optional[str], truncate_notes: bool,
+) -> str:
+    """Format a get_projects result page as text, headed by the total count."""
+    if not projects:
+        if query:
+            return f"No {descriptor} found matching '{query}'"
+        return f"Found 0 {descriptor}"
+
+    if query:
+        header = f"Found {len(projects)} {descriptor} matching '{query}'{page_desc}:\n\n"
+    else:
+        header = f"Found {len(projects)} {descriptor}{page_desc}:\n\n"
+    return header + "".join(
+        _format_project(proj, truncate_notes) + "\n" for proj in page
+    )
+
+
+def _format_tag(tag: dict) -> str:
+    """Format a tag dictionary as human-readable text.
+
+    Args:
+        tag: Tag dictionary from omnifocus_connector
+
+    Returns:
+        Formatted tag text
+    """
+    text = f"ID: {tag['id']}\nName: {tag['name']}\nStatus: {tag['status']}\n"
+    if tag.get('childrenAreMutuallyExclusive'):
+        text += "Children Are Mutually Exclusive: Yes\n"
+    return text
 
 
 # ============================================================================
 # Project Tools
 # ============================================================================
 
-@mcp.tool()
+@_tool(single_flight=True, cache=True)
 def get_projects(
     project_id: Optional[str] = None,
     include_full_notes: bool = False,
@@ -253,6 +826,9 @@ def get_projects(
     modified_before: Optional[str] = None,
     min_task_count: Optional[int] = None,
     has_no_due_dates: Optional[bool] = None,
+    limit: Optional[int] = None,
+    offset: int = 0,
+    response_format: str = "text",
 ) -> str:
     """Retrieve projects with optional filtering.
 
@@ -277,78 +853,11 @@ def get_projects(
     - min_task_count: int
     - has_no_due_dates: bool
     - sort_by: str -- "name", "due_date", "defer_date", "planned_date", "creation_date", "modification_date", "completion_date", "dropped_date"; sort_order: str -- "asc"/"desc"
+    - limit: int, offset: int -- return one page of the filtered, sorted results
+    - response_format: str -- "text" (default) or "json" (compact {"count", "items"} with the fields below)
 
     Returns: id, name, folderPath, status, projectType, sequential (deprecated), completedByChildren, flagged, creationDate, modificationDate, completionDate, droppedDate, dueDate, deferDate, plannedDate, tags, note, lastReviewDate, nextReviewDate, reviewIntervalValue, reviewIntervalUnit. Optional health/activity fields when requested.
     """
-    # Expand _on params to _after + _before (single-day range)
-    from datetime import date, timedelta
-
-    def _expand_on(on_name, on_val, after_val, before_val):
-        if on_val is None:
-            return after_val, before_val, None
-        if after_val is not None or before_val is not None:
-            after_name = on_name.replace("_on", "_after")
-            before_name = on_name.replace("_on", "_before")
-            return None, None, f"Error: {on_name} is mutually exclusive with {after_name}/{before_name}."
-        try:
-            d = date.fromisoformat(on_val)
-            return on_val, (d + timedelta(days=1)).isoformat(), None
-        except ValueError:
-            return None, None, f"Error: Invalid date format for {on_name}: '{on_val}'. Use ISO 8601 (e.g., '2026-03-23')."
-
-    planned_after, planned_before, err = _expand_on("planned_on", planned_on, planned_after, planned_before)
-    if err: return err
-    due_after, due_before, err = _expand_on("due_on", due_on, due_after, due_before)
-    if err: return err
-    defer_after, defer_before, err = _expand_on("defer_on", defer_on, defer_after, defer_before)
-    if err: return err
-    completion_after, completion_before, err = _expand_on("completion_on", completion_on, completion_after, completion_before)
-    if err: return err
-    dropped_after, dropped_before, err = _expand_on("dropped_on", dropped_on, dropped_after, dropped_before)
-    if err: return err
-    created_after, created_before, err = _expand_on("created_on", created_on, created_after, created_before)
-    if err: return err
-    modified_after, modified_before, err = _expand_on("modified_on", modified_on, modified_after, modified_before)
-    if err: return err
-
-    client = get_client()
-    try:
-        projects = client.get_projects(
-            project_id=project_id,
-            include_full_notes=include_full_notes,
-            on_hold_only=on_hold_only,
-            query=query,
-            include_task_health=include_task_health,
-            include_last_activity=include_last_activity,
-            stalled_only=stalled_only,
-            flagged_only=flagged_only,
-            include_dropped=include_dropped,
-            include_completed=include_completed,
-            completed_only=completed_only,
-            tag_filter=tag_filter,
-            planned_after=planned_after,
-            planned_before=planned_before,
-            has_overdue_tasks=has_overdue_tasks,
-            sort_by=sort_by,
-            sort_order=sort_order,
-            modified_after=modified_after,
-            modified_before=modified_before,
-            created_after=created_after,
-            created_before=created_before,
-            due_after=due_after,
-            due_before=due_before,
-            defer_after=defer_after,
-            defer_before=defer_before,
-            completion_after=completion_after,
-            completion_before=completion_before,
-            dropped_after=dropped_after,
-            dropped_before=dropped_before,
-            min_task_count=min_task_count,
-            has_no_due_dates=has_no_due_dates,
-        )
-    except ValueError as e:
-        return f"Error: {str(e)}"
-
     # Build descriptor based on filter
     if project_id:
         descriptor = "project"
@@ -367,21 +876,41 @@ def get_projects(
     else:
         descriptor = "active projects"
 
-    if not projects:
-        if query:
-            return f"No {descriptor} found matching '{query}'"
-        return f"Found 0 {descriptor}"
-
-    # Format projects for display
-    if query:
-        result = f"Found {len(projects)} {descriptor} matching '{query}':\n\n"
-    else:
-        result = f"Found {len(projects)} {descriptor}:\n\n"
-    for proj in projects:
-        result += _format_project(proj, truncate_notes=(not include_full_notes))
-        result += "\n"
-
-    return result
+    truncate_notes = not include_full_notes
+    return _list_response(
+        lambda **dates: get_client().get_projects(
+            project_id=project_id,
+            include_full_notes=include_full_notes,
+            note_limit=None if include_full_notes else NOTE_TRUNCATION_LENGTH,
+            on_hold_only=on_hold_only,
+            query=query,
+            include_task_health=include_task_health,
+            include_last_activity=include_last_activity,
+            stalled_only=stalled_only,
+            flagged_only=flagged_only,
+            include_dropped=include_dropped,
+            include_completed=include_completed,
+            completed_only=completed_only,
+            tag_filter=tag_filter,
+            has_overdue_tasks=has_overdue_tasks,
+            sort_by=sort_by,
+            sort_order=sort_order,
+            min_task_count=min_task_count,
+            has_no_due_dates=has_no_due_dates,
+            **dates,
+        ),
+        {
+            "planned": (planned_on, planned_after, planned_before),
+            "due": (due_on, due_after, due_before),
+            "defer": (defer_on, defer_after, defer_before),
+            "completion": (completion_on, completion_after, completion_before),
+            "dropped": (dropped_on, dropped_after, dropped_before),
+            "created": (created_on, created_after, created_before),
+            "modified": (modified_on, modified_after, modified_before),
+        },
+        limit, offset, response_format, truncate_notes,
+        functools.partial(_format_project_list, descriptor=descriptor, query=query, truncate_notes=truncate_notes),
+    )
 
 
 def create_project(
@@ -512,7 +1041,7 @@ def update_project(
     return update_projects(projects=[project_dict])
 
 
-@mcp.tool()
+@_tool(invalidates=_AFFECTS_PROJECTS)
 def update_projects(projects: list[ProjectUpdate]) -> str:
     """Update one or more projects. Each item has id (required) plus fields to change.
 
@@ -540,25 +1069,13 @@ def update_projects(projects: list[ProjectUpdate]) -> str:
     except Exception as e:
         return f"Error: Invalid project input: {e}"
 
-    results = []
-    for project in projects:
-        try:
-            # Build kwargs, excluding None values and the id field
-            kwargs = project.model_dump(exclude_none=True, exclude={"id"})
-            result = client.update_project(project_id=project.id, **kwargs)
-            results.append({
-                "id": project.id,
-                "success": result["success"],
-                "updated_fields": result.get("updated_fields", []),
-                "error": result.get("error"),
-            })
-        except (ValueError, Exception) as e:
-            results.append({
-                "id": project.id,
-                "success": False,
-                "updated_fields": [],
-                "error": str(e),
-            })
+    results = _apply_updates(
+        client,
+        projects,
+        update_one=lambda item_id, **fields: client.update_project(project_id=item_id, **fields),
+        update_many=client.update_projects,
+        id_key="project_id",
+    )
 
     succeeded = [r for r in results if r["success"]]
     failed = [r for r in results if not r["success"]]
@@ -588,7 +1105,7 @@ def update_projects(projects: list[ProjectUpdate]) -> str:
 
 
 
-@mcp.tool()
+@_tool(single_flight=True)
 def get_tasks(
     task_id: Optional[str] = None,
     parent_task_id: Optional[str] = None,
@@ -631,6 +1148,9 @@ def get_tasks(
     dropped_on: Optional[str] = None,
     created_on: Optional[str] = None,
     modified_on: Optional[str] = None,
+    limit: Optional[int] = None,
+    offset: int = 0,
+    response_format: str = "text",
 ) -> str:
     """Get tasks with optional filtering.
 
@@ -651,6 +1171,8 @@ def get_tasks(
     - has_estimate: bool
     - recurring_only: bool
     - sort_by: str -- "name", "due_date", "defer_date", "planned_date", "creation_date", "modification_date", "completion_date", "dropped_date"; sort_order: str
+    - limit: int, offset: int -- return one page of the filtered, sorted results
+    - response_format: str -- "text" (default) or "json" (compact {"count", "items"} with the fields below)
 
     Returns: id, name, projectName, completed, dropped, blocked, available, next, flagged, dueDate, deferDate, plannedDate, estimatedMinutes, tags, note, parentTaskId, subtaskCount, sequential, isRecurring, recurrence, repetitionMethod, repeatSummary, nextDueDate, nextDeferDate, nextPlannedDate, catchUpAutomatically, creationDate, modificationDate, completionDate, droppedDate.
 
@@ -662,44 +1184,13 @@ def get_tasks(
     - Date fields are effective (include inherited from project). Next-occurrence fields populated only for recurring tasks.
     - Tasks inherit tags from their parent project. A task showing a tag it wasn't explicitly assigned has inherited it -- this is expected, not a bug.
     """
-    # Expand _on params to _after + _before (single-day range)
-    from datetime import date, timedelta
-
-    def _expand_on(on_name, on_val, after_val, before_val):
-        """Expand a date _on param to _after + _before range. Returns (after, before, error)."""
-        if on_val is None:
-            return after_val, before_val, None
-        if after_val is not None or before_val is not None:
-            after_name = on_name.replace("_on", "_after")
-            before_name = on_name.replace("_on", "_before")
-            return None, None, f"Error: {on_name} is mutually exclusive with {after_name}/{before_name}."
-        try:
-            d = date.fromisoformat(on_val)
-            return on_val, (d + timedelta(days=1)).isoformat(), None
-        except ValueError:
-            return None, None, f"Error: Invalid date format for {on_name}: '{on_val}'. Use ISO 8601 (e.g., '2026-03-23')."
-
-    planned_after, planned_before, err = _expand_on("planned_on", planned_on, planned_after, planned_before)
-    if err: return err
-    due_after, due_before, err = _expand_on("due_on", due_on, due_after, due_before)
-    if err: return err
-    defer_after, defer_before, err = _expand_on("defer_on", defer_on, defer_after, defer_before)
-    if err: return err
-    completion_after, completion_before, err = _expand_on("completion_on", completion_on, completion_after, completion_before)
-    if err: return err
-    dropped_after, dropped_before, err = _expand_on("dropped_on", dropped_on, dropped_after, dropped_before)
-    if err: return err
-    created_after, created_before, err = _expand_on("created_on", created_on, created_after, created_before)
-    if err: return err
-    modified_after, modified_before, err = _expand_on("modified_on", modified_on, modified_after, modified_before)
-    if err: return err
-
-    client = get_client()
-    try:
-        tasks = client.get_tasks(
+    truncate_notes = not include_full_notes
+    return _list_response(
+        lambda **dates: get_client().get_tasks(
             task_id=task_id,
             parent_task_id=parent_task_id,
             include_full_notes=include_full_notes,
+            note_limit=None if include_full_notes else NOTE_TRUNCATION_LENGTH,
             project_id=project_id,
             flagged_only=flagged_only,
             include_completed=include_completed,
@@ -714,49 +1205,23 @@ def get_tasks(
             inbox_only=inbox_only,
             sort_by=sort_by,
             sort_order=sort_order,
-            modified_after=modified_after,
-            modified_before=modified_before,
-            created_after=created_after,
-            created_before=created_before,
             max_estimated_minutes=max_estimated_minutes,
             has_estimate=has_estimate,
             recurring_only=recurring_only,
-            planned_after=planned_after,
-            planned_before=planned_before,
-            due_after=due_after,
-            due_before=due_before,
-            defer_after=defer_after,
-            defer_before=defer_before,
-            completion_after=completion_after,
-            completion_before=completion_before,
-            dropped_after=dropped_after,
-            dropped_before=dropped_before,
-        )
-    except ValueError as e:
-        return f"Error: {str(e)}"
-
-    if not tasks:
-        if query:
-            return f"No tasks found matching '{query}'"
-        elif inbox_only:
-            return "No tasks in inbox"
-        return "Found 0 tasks"
-
-    # Build descriptive result message
-    if query and inbox_only:
-        result = f"Found {len(tasks)} inbox tasks matching '{query}':\n\n"
-    elif query:
-        result = f"Found {len(tasks)} tasks matching '{query}':\n\n"
-    elif inbox_only:
-        result = f"Found {len(tasks)} inbox tasks:\n\n"
-    else:
-        result = f"Found {len(tasks)} tasks:\n\n"
-
-    for task in tasks:
-        result += _format_task(task, truncate_notes=(not include_full_notes))
-        result += "\n"
-
-    return result
+            **dates,
+        ),
+        {
+            "planned": (planned_on, planned_after, planned_before),
+            "due": (due_on, due_after, due_before),
+            "defer": (defer_on, defer_after, defer_before),
+            "completion": (completion_on, completion_after, completion_before),
+            "dropped": (dropped_on, dropped_after, dropped_before),
+            "created": (created_on, created_after, created_before),
+            "modified": (modified_on, modified_after, modified_before),
+        },
+        limit, offset, response_format, truncate_notes,
+        functools.partial(_format_task_list, query=query, inbox_only=inbox_only, truncate_notes=truncate_notes),
+    )
 
 
 
@@ -856,7 +1321,7 @@ class TaskUpdate(BaseModel):
     completed_by_children: Optional[bool] = None
 
 
-@mcp.tool()
+@_tool(invalidates=_AFFECTS_PROJECTS)
 def create_tasks(tasks: list[TaskCreate]) -> str:
     """Create one or more tasks.
 
@@ -882,20 +1347,21 @@ def create_tasks(tasks: list[TaskCreate]) -> str:
     except Exception as e:
         return f"Error: Invalid task input: {e}"
 
-    for task in tasks:
-        try:
-            task_id = client.create_task(**task.model_dump())
-            results.append({
-                "task_name": task.task_name,
-                "task_id": task_id,
-                "success": True,
-            })
-        except (ValueError, Exception) as e:
-            results.append({
-                "task_name": task.task_name,
-                "success": False,
-                "error": str(e),
-            })
+    with _autosave_suspended(client, len(tasks)):
+        for task in tasks:
+            try:
+                task_id = client.create_task(**task.model_dump())
+                results.append({
+                    "task_name": task.task_name,
+                    "task_id": task_id,
+                    "success": True,
+                })
+            except (ValueError, Exception) as e:
+                results.append({
+                    "task_name": task.task_name,
+                    "success": False,
+                    "error": str(e),
+                })
 
     succeeded = [r for r in results if r["success"]]
     failed = [r for r in results if not r["success"]]
@@ -935,7 +1401,7 @@ def create_tasks(tasks: list[TaskCreate]) -> str:
 # ============================================================================
 
 
-@mcp.tool()
+@_tool(invalidates=_AFFECTS_PROJECTS)
 def create_projects(projects: list[ProjectCreate]) -> str:
     """Create one or more projects.
 
@@ -958,20 +1424,21 @@ def create_projects(projects: list[ProjectCreate]) -> str:
         return f"Error: Invalid project input: {e}"
 
     results = []
-    for project in projects:
-        try:
-            project_id = client.create_project(**project.model_dump())
-            results.append({
-                "name": project.name,
-                "project_id": project_id,
-                "success": True,
-            })
-        except (ValueError, Exception) as e:
-            results.append({
-                "name": project.name,
-                "success": False,
-                "error": str(e),
-            })
+    with _autosave_suspended(client, len(projects)):
+        for project in projects:
+            try:
+                project_id = client.create_project(**project.model_dump())
+                results.append({
+                    "name": project.name,
+                    "project_id": project_id,
+                    "success": True,
+                })
+            except (ValueError, Exception) as e:
+                results.append({
+                    "name": project.name,
+                    "success": False,
+                    "error": str(e),
+                })
 
     succeeded = [r for r in results if r["success"]]
     failed = [r for r in results if not r["success"]]
@@ -1067,7 +1534,7 @@ def update_task(
     return update_tasks(tasks=[task_dict])
 
 
-@mcp.tool()
+@_tool(invalidates=_AFFECTS_PROJECTS)
 def update_tasks(tasks: list[TaskUpdate]) -> str:
     """Update one or more tasks. Each item has id (required) plus fields to change.
 
@@ -1091,25 +1558,14 @@ def update_tasks(tasks: list[TaskUpdate]) -> str:
     except Exception as e:
         return f"Error: Invalid task input: {e}"
 
-    results = []
-    for task in tasks:
-        try:
-            # Build kwargs, excluding None values and the id field
-            kwargs = task.model_dump(exclude_none=True, exclude={"id"})
-            result = client.update_task(task_id=task.id, **kwargs)
-            results.append({
-                "id": task.id,
-                "success": result["success"],
-                "updated_fields": result.get("updated_fields", []),
-                "error": result.get("error"),
-            })
-        except (ValueError, Exception) as e:
-            results.append({
-                "id": task.id,
-                "success": False,
-                "updated_fields": [],
-                "error": str(e),
-            })
+    results = _apply_updates(
+        client,
+        tasks,
+        update_one=lambda item_id, **fields: client.update_task(task_id=item_id, **fields),
+        update_many=client.update_tasks,
+        id_key="task_id",
+        batch_fields=_TASK_BATCH_FIELDS,
+    )
 
     succeeded = [r for r in results if r["success"]]
     failed = [r for r in results if not r["success"]]
@@ -1140,28 +1596,30 @@ def update_tasks(tasks: list[TaskUpdate]) -> str:
 
 
 
-@mcp.tool()
-def get_tags() -> str:
+@_tool(single_flight=True, cache=True)
+def get_tags(response_format: str = "text") -> str:
     """Retrieve all tags.
 
+    Parameters:
+    - response_format: str -- "text" (default) or "json" (compact {"count", "items"} with the fields below)
+
     Returns: id, name, status ("active"/"on hold"/"dropped"), parentTagId (empty if top-level; create/update accept parent by NAME not ID), childrenAreMutuallyExclusive (assigning one child silently removes siblings).
     """
+    err = _validate_response_format(response_format)
+    if err: return err
+
     client = get_client()
     tags = client.get_tags()
 
+    if response_format == "json":
+        return _json_response(tags, tags)
+
     if not tags:
         return "Found 0 tags"
 
-    result = f"Found {len(tags)} tags:\n\n"
-    for tag in tags:
-        result += f"ID: {tag['id']}\n"
-        result += f"Name: {tag['name']}\n"
-        result += f"Status: {tag['status']}\n"
-        if tag.get('childrenAreMutuallyExclusive'):
-            result += "Children Are Mutually Exclusive: Yes\n"
-        result += "\n"
-
-    return result
+    return f"Found {len(tags)} tags:\n\n" + "".join(
+        _format_tag(tag) + "\n" for tag in tags
+    )
 
 
 # ============================================================================
@@ -1201,7 +1659,7 @@ def create_tag(
     }])
 
 
-@mcp.tool()
+@_tool(invalidates=_AFFECTS_TAGS)
 def create_tags(tags: list[TagCreate]) -> str:
     """Create one or more tags.
 
@@ -1218,12 +1676,13 @@ def create_tags(tags: list[TagCreate]) -> str:
     except Exception as e:
         return f"Error: Invalid tag input: {e}"
 
-    for tag in tags:
-        try:
-            tag_id = client.create_tag(**tag.model_dump())
-            results.append({"name": tag.name, "tag_id": tag_id, "success": True})
-        except (ValueError, Exception) as e:
-            results.append({"name": tag.name, "success": False, "error": str(e)})
+    with _autosave_suspended(client, len(tags)):
+        for tag in tags:
+            try:
+                tag_id = client.create_tag(**tag.model_dump())
+                results.append({"name": tag.name, "tag_id": tag_id, "success": True})
+            except (ValueError, Exception) as e:
+                results.append({"name": tag.name, "success": False, "error": str(e)})
 
     succeeded = [r for r in results if r["success"]]
     failed = [r for r in results if not r["success"]]
@@ -1265,7 +1724,7 @@ def update_tag(
     return update_tags(tags=[tag_dict])
 
 
-@mcp.tool()
+@_tool(invalidates=_AFFECTS_TAGS)
 def update_tags(tags: list[TagUpdate]) -> str:
     """Update one or more tags. Each item has id (required) plus fields to change.
 
@@ -1283,18 +1742,19 @@ def update_tags(tags: list[TagUpdate]) -> str:
     except Exception as e:
         return f"Error: Invalid tag update input: {e}"
 
-    for tag in tags:
-        try:
-            params = tag.model_dump(exclude_none=True, exclude={"id"})
-            result = client.update_tag(tag_id=tag.id, **params)
-            results.append({
-                "id": tag.id,
-                "success": result.get("success", True),
-                "updated_fields": result.get("updated_fields", []),
-                "error": result.get("error"),
-            })
-        except (ValueError, Exception) as e:
-            results.append({"id": tag.id, "success": False, "updated_fields": [], "error": str(e)})
+    with _autosave_suspended(client, len(tags)):
+        for tag in tags:
+            try:
+                params = tag.model_dump(exclude_none=True, exclude={"id"})
+                result = client.update_tag(tag_id=tag.id, **params)
+                results.append({
+                    "id": tag.id,
+                    "success": result.get("success", True),
+                    "updated_fields": result.get("updated_fields", []),
+                    "error": result.get("error"),
+                })
+            except (ValueError, Exception) as e:
+                results.append({"id": tag.id, "success": False, "updated_fields": [], "error": str(e)})
 
     succeeded = [r for r in results if r["success"]]
     failed = [r for r in results if not r["success"]]
@@ -1318,7 +1778,7 @@ def update_tags(tags: list[TagUpdate]) -> str:
     return "\n".join(lines)
 
 
-@mcp.tool()
+@_tool(invalidates=_AFFECTS_TAGS)
 def delete_tags(tag_ids: Union[str, list[str]]) -> str:
     """Delete tags. Tasks lose tag association but are not deleted.
 
@@ -1344,12 +1804,12 @@ def delete_tags(tag_ids: Union[str, list[str]]) -> str:
         else:
             return f"Deleted {deleted_count} tags successfully, {failed_count} failed"
     except ValueError as e:
-        return f"Error: {str(e)}"
+        return f"Error: {e}"
     except Exception as e:
-        return f"Error deleting tags: {str(e)}"
+        return f"Error deleting tags: {e}"
 
 
-@mcp.tool()
+@_tool(invalidates=_AFFECTS_PROJECTS)
 def delete_tasks(task_ids: Union[str, list[str]]) -> str:
     """Permanently delete tasks. Cannot be undone.
 
@@ -1380,12 +1840,12 @@ def delete_tasks(task_ids: Union[str, list[str]]) -> str:
             # Partial success
             return f"Deleted {deleted_count} tasks successfully, {failed_count} failed"
     except ValueError as e:
-        return f"Error: {str(e)}"
+        return f"Error: {e}"
     except Exception as e:
-        return f"Error deleting tasks: {str(e)}"
+        return f"Error deleting tasks: {e}"
 
 
-@mcp.tool()
+@_tool(invalidates=_AFFECTS_PROJECTS)
 def delete_projects(project_ids: Union[str, list[str]]) -> str:
     """Permanently delete projects and all their tasks. Cannot be undone.
 
@@ -1411,9 +1871,9 @@ def delete_projects(project_ids: Union[str, list[str]]) -> str:
         else:
             return f"Deleted {deleted_count} of {total_count} projects ({failed_count} failed)"
     except ValueError as e:
-        return f"Error: {str(e)}"
+        return f"Error: {e}"
     except Exception as e:
-        return f"Error deleting projects: {str(e)}"
+        return f"Error deleting projects: {e}"
 
 
 # ============================================================================
@@ -1424,28 +1884,36 @@ def delete_projects(project_ids: Union[str, list[str]]) -> str:
 
 
 
-@mcp.tool()
-def get_folders() -> str:
+@_tool(single_flight=True, cache=True)
+def get_folders(response_format: str = "text") -> str:
     """Get all folders with hierarchy.
 
+    Parameters:
+    - response_format: str -- "text" (default) or "json" (compact {"count", "items"} with the fields below)
+
     Returns: id, name, path (e.g. "Work > Clients"), status ("active"/"dropped").
     """
+    err = _validate_response_format(response_format)
+    if err: return err
+
     client = get_client()
     folders = client.get_folders()
 
+    if response_format == "json":
+        return _json_response(folders, folders)
+
     if not folders:
         return "Found 0 folders"
 
     # Format folders for display
-    result = f"Found {len(folders)} folders:\n\n"
-    for folder in folders:
-        result += f"ID: {folder['id']}\n"
-        result += f"Name: {folder['name']}\n"
-        result += f"Path: {folder['path']}\n"
-        result += f"Status: {folder.get('status', 'active')}\n"
-        result += "---\n"
-
-    return result
+    return f"Found {len(folders)} folders:\n\n" + "".join(
+        f"ID: {folder['id']}\n"
+        f"Name: {folder['name']}\n"
+        f"Path: {folder['path']}\n"
+        f"Status: {folder.get('status', 'active')}\n"
+        "---\n"
+        for folder in folders
+    )
 
 
 # ============================================================================
@@ -1474,7 +1942,7 @@ def create_folder(name: str, parent_path: Optional[str] = None) -> str:
     return create_folders(folders=[{"name": name, "parent_path": parent_path}])
 
 
-@mcp.tool()
+@_tool(invalidates=_AFFECTS_FOLDERS)
 def create_folders(folders: list[FolderCreate]) -> str:
     """Create one or more folders.
 
@@ -1490,12 +1958,13 @@ def create_folders(folders: list[FolderCreate]) -> str:
     except Exception as e:
         return f"Error: Invalid folder input: {e}"
 
-    for folder in folders:
-        try:
-            folder_id = client.create_folder(**folder.model_dump())
-            results.append({"name": folder.name, "folder_id": folder_id, "success": True})
-        except (ValueError, Exception) as e:
-            results.append({"name": folder.name, "success": False, "error": str(e)})
+    with _autosave_suspended(client, len(folders)):
+        for folder in folders:
+            try:
+                folder_id = client.create_folder(**folder.model_dump())
+                results.append({"name": folder.name, "folder_id": folder_id, "success": True})
+            except (ValueError, Exception) as e:
+                results.append({"name": folder.name, "success": False, "error": str(e)})
 
     succeeded = [r for r in results if r["success"]]
     failed = [r for r in results if not r["success"]]
@@ -1535,7 +2004,7 @@ def update_folder(
     return update_folders(folders=[folder_dict])
 
 
-@mcp.tool()
+@_tool(invalidates=_AFFECTS_FOLDERS)
 def update_folders(folders: list[FolderUpdate]) -> str:
     """Update one or more folders. Each item has id (required) plus fields to change.
 
@@ -1552,18 +2021,19 @@ def update_folders(folders: list[FolderUpdate]) -> str:
     except Exception as e:
         return f"Error: Invalid folder update input: {e}"
 
-    for folder in folders:
-        try:
-            params = folder.model_dump(exclude_none=True, exclude={"id"})
-            result = client.update_folder(folder_id=folder.id, **params)
-            results.append({
-                "id": folder.id,
-                "success": result.get("success", True),
-                "updated_fields": result.get("updated_fields", []),
-                "error": result.get("error"),
-            })
-        except (ValueError, Exception) as e:
-            results.append({"id": folder.id, "success": False, "updated_fields": [], "error": str(e)})
+    with _autosave_suspended(client, len(folders)):
+        for folder in folders:
+            try:
+                params = folder.model_dump(exclude_none=True, exclude={"id"})
+                result = client.update_folder(folder_id=folder.id, **params)
+                results.append({
+                    "id": folder.id,
+                    "success": result.get("success", True),
+                    "updated_fields": result.get("updated_fields", []),
+                    "error": result.get("error"),
+                })
+            except (ValueError, Exception) as e:
+                results.append({"id": folder.id, "success": False, "updated_fields": [], "error": str(e)})
 
     succeeded = [r for r in results if r["success"]]
     failed = [r for r in results if not r["success"]]
@@ -1591,7 +2061,7 @@ def update_folders(folders: list[FolderUpdate]) -> str:
 # Task Hierarchy Tools
 # ============================================================================
 
-@mcp.tool()
+@_tool(invalidates=_AFFECTS_PROJECTS)
 def reorder_task(task_id: str, before_task_id: Optional[str] = None, after_task_id: Optional[str] = None) -> str:
     """Move a task before or after another task within the same project/level.
 
@@ -1612,12 +2082,12 @@ def reorder_task(task_id: str, before_task_id: Optional[str] = None, after_task_
         else:
             return f"Error: Failed to reorder task {task_id}"
     except ValueError as e:
-        return f"Error: {str(e)}"
+        return f"Error: {e}"
     except Exception as e:
-        return f"Error reordering task: {str(e)}"
+        return f"Error reordering task: {e}"
 
 
-@mcp.tool()
+@_tool(invalidates=_AFFECTS_PROJECTS)
 def reorder_project(project_id: str, before_project_id: Optional[str] = None, after_project_id: Optional[str] = None) -> str:
     """Move a project before or after another project within the same folder.
 
@@ -1638,14 +2108,14 @@ def reorder_project(project_id: str, before_project_id: Optional[str] = None, af
         else:
             return f"Error: Failed to reorder project {project_id}"
     except ValueError as e:
-        return f"Error: {str(e)}"
+        return f"Error: {e}"
     except Exception as e:
-        return f"Error reordering project: {str(e)}"
+        return f"Error reordering project: {e}"
 
 
 
 
-@mcp.tool()
+@_tool(single_flight=True, cache=True)
 def get_perspectives() -> str:
     """Get all perspectives.
 
@@ -1657,19 +2127,18 @@ def get_perspectives() -> str:
     if not perspectives:
         return "Found 0 perspectives"
 
-    result = f"Found {len(perspectives)} perspectives:\n\n"
+    lines = []
     for p in perspectives:
-        parts = [p["name"]]
-        parts.append(p.get("type", "unknown"))
+        details = p.get("type", "unknown")
         pid = p.get("id")
         if pid:
-            parts.append(f"ID: {pid}")
-        result += f"- {parts[0]} ({', '.join(parts[1:])})\n"
+            details += f", ID: {pid}"
+        lines.append(f"- {p['name']} ({details})\n")
 
-    return result
+    return f"Found {len(perspectives)} perspectives:\n\n" + "".join(lines)
 
 
-@mcp.tool()
+@_tool(invalidates=())
 def switch_perspective(perspective_name: str) -> str:
     """Switch front window to a perspective.
 
@@ -1680,10 +2149,10 @@ def switch_perspective(perspective_name: str) -> str:
         result = client.switch_perspective(perspective_name)
         return f"Successfully switched to perspective: {result}"
     except Exception as e:
-        return f"Error switching perspective: {str(e)}"
+        return f"Error switching perspective: {e}"
 
 
-@mcp.tool()
+@_tool(invalidates=())
 def set_focus(
     item_ids: str | list[str] = None,
     item_types: str | list[str] = None,
@@ -1705,12 +2174,12 @@ def set_focus(
         )
         return f"Focus set on {len(focused)} item(s): {items_desc}"
     except ValueError as e:
-        return f"Invalid input: {str(e)}"
+        return f"Invalid input: {e}"
     except Exception as e:
-        return f"Error setting focus: {str(e)}"
+        return f"Error setting focus: {e}"
 
 
-@mcp.tool()
+@_tool(single_flight=True)
 def get_focus() -> str:
     """Get currently focused items.
     """
@@ -1719,17 +2188,32 @@ def get_focus() -> str:
         items = client.get_focus()
         if not items:
             return "No focus set."
-        result = f"Currently focused on {len(items)} item(s):\n\n"
-        for item in items:
-            result += f"- {item['name']} ({item['type']}, ID: {item['id']})\n"
-        return result
+        return f"Currently focused on {len(items)} item(s):\n\n" + "".join(
+            f"- {item['name']} ({item['type']}, ID: {item['id']})\n" for item in items
+        )
     except Exception as e:
-        return f"Error getting focus: {str(e)}"
+        return f"Error getting focus: {e}"
 
 
 # ============================================================================
 # Server Entry Point
 # ============================================================================
 
-if __name__ == "__main__":
+def _restore_autosave() -> None:
+    """Re-enable autosave if a previous server run died inside _autosave_suspended."""
+    try:
+        if get_client().restore_autosave():
+            logger.warning("OmniFocus autosave was left off by an interrupted batch; re-enabled it")
+    except Exception as e:
+        logger.warning("Could not check OmniFocus autosave: %s", e)
+
+
+def main() -> None:
+    """Run the MCP server over stdio (console script entry point)."""
+    _configure_logging()
+    _restore_autosave()
     mcp.run()
+
+
+if __name__ == "__main__":
+    main()
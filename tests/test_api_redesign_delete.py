@@ -51,6 +51,42 @@ class TestDeleteTasksRedesign:
             assert result["failed_count"] == 0
             assert len(result["deleted_ids"]) == 3
 
+    def test_delete_tasks_suspends_autosave_in_script(self, client):
+        """delete_tasks() turns autosave off for the loop and restores it after."""
+        with mock.patch('omnifocus_mcp.omnifocus_connector.run_applescript') as mock_run:
+            mock_run.return_value = "2"
+
+            client.delete_tasks(["task-001", "task-002"])
+
+            script = mock_run.call_args[0][0]
+            off = script.index("set will autosave to false")
+            loop = script.index("repeat with taskId in taskIdList")
+            restore = script.index("set will autosave to previousAutosave")
+            assert off < loop < restore
+
+    def test_delete_tasks_restores_autosave_on_timeout(self, client):
+        """A script killed by the timeout cannot restore autosave itself; delete_tasks() does."""
+        timeout = subprocess.TimeoutExpired(cmd="osascript", timeout=60)
+        with mock.patch('omnifocus_mcp.omnifocus_connector.run_applescript') as mock_run:
+            mock_run.side_effect = [timeout, "restored"]
+
+            with pytest.raises(subprocess.TimeoutExpired):
+                client.delete_tasks(["task-001", "task-002"])
+
+            restore_script = mock_run.call_args_list[1][0][0]
+            assert "set will autosave to true" in restore_script
+
+    def test_delete_tasks_failed_restore_keeps_original_error(self, client):
+        """If restoring autosave also fails, the script's own error is still raised."""
+        error = subprocess.CalledProcessError(1, "osascript", stderr="boom")
+        with mock.patch('omnifocus_mcp.omnifocus_connector.run_applescript') as mock_run:
+            mock_run.side_effect = [error, error]
+
+            with pytest.raises(Exception, match="Error deleting tasks: boom"):
+                client.delete_tasks(["task-001", "task-002"])
+
+            assert mock_run.call_count == 2
+
     # ========================================================================
     # Return Format (Dict instead of int)
     # ========================================================================
@@ -110,6 +146,20 @@ class TestDeleteTasksRedesign:
             assert result["failed_count"] == 2
             assert len(result["deleted_ids"]) == 0
 
+    def test_delete_tasks_reports_which_ids_failed(self, client):
+        """delete_tasks() names the failed IDs instead of assuming the first N succeeded."""
+        with mock.patch('omnifocus_mcp.omnifocus_connector.run_applescript') as mock_run:
+            mock_run.return_value = "2\ntask-001"
+
+            result = client.delete_tasks(["task-001", "task-002", "task-003"])
+
+            script = mock_run.call_args[0][0]
+            assert "set end of failedIds to (contents of taskId)" in script
+            assert result["deleted_ids"] == ["task-002", "task-003"]
+            assert result["failures"] == [
+                {"task_id": "task-001", "error": "Task not found or delete failed"}
+            ]
+
     # ========================================================================
     # Validation
     # ========================================================================
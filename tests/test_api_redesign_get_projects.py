@@ -3,6 +3,7 @@
 NEW API (Phase 3.2): Enhanced get_projects() with project_id and include_full_notes parameters
 to consolidate get_project() and get_note() functionality.
 """
+import json
 import pytest
 from unittest import mock
 from omnifocus_mcp.omnifocus_connector import OmniFocusConnector
@@ -44,6 +45,16 @@ class TestGetProjectsEnhancements:
             # Should filter to specific project by ID
             assert 'whose id is "proj-001"' in applescript
 
+    def test_get_projects_flagged_only_filters_applescript(self, client):
+        """flagged_only is evaluated by OmniFocus in the project source."""
+        with mock.patch('omnifocus_mcp.omnifocus_connector.run_applescript') as mock_run:
+            mock_run.return_value = '[]'
+
+            client.get_projects(flagged_only=True)
+
+            applescript = mock_run.call_args[0][0]
+            assert '(flattened projects whose flagged is true)' in applescript
+
     def test_get_projects_project_id_with_other_filters(self, client):
         """NEW API: project_id can be combined with other parameters."""
         with mock.patch('omnifocus_mcp.omnifocus_connector.run_applescript') as mock_run:
@@ -83,6 +94,20 @@ class TestGetProjectsEnhancements:
             assert "note" in result[0]
             assert len(result[0]["note"]) > 0
 
+    def test_get_projects_include_full_notes_fetches_notes_in_one_script(self, client):
+        """include_full_notes reads every note in the batch pass, not per project."""
+        with mock.patch('omnifocus_mcp.omnifocus_connector.run_applescript') as mock_run:
+            mock_run.return_value = json.dumps(
+                [{"id": f"proj-{i:03d}", "name": f"Project {i}", "note": "Note " * 50}
+                 for i in range(100)]
+            )
+
+            result = client.get_projects(include_full_notes=True)
+
+            assert len(result) == 100
+            assert mock_run.call_count == 1
+            assert "set notes to note of fp" in mock_run.call_args[0][0]
+
     def test_get_projects_include_full_notes_with_project_id(self, client):
         """NEW API: Combine include_full_notes with project_id."""
         with mock.patch('omnifocus_mcp.omnifocus_connector.run_applescript') as mock_run:
@@ -122,3 +147,34 @@ class TestGetProjectsEnhancements:
             client.get_projects(on_hold_only=False, query="test")
 
             assert mock_run.called
+
+    def test_get_projects_note_limit_truncates_in_applescript(self, client):
+        """note_limit truncates notes inside AppleScript before JSON encoding."""
+        with mock.patch('omnifocus_mcp.omnifocus_connector.run_applescript') as mock_run:
+            mock_run.return_value = '[]'
+
+            client.get_projects(note_limit=100)
+
+            applescript = mock_run.call_args[0][0]
+            assert 'text 1 thru 100 of projNote' in applescript
+            assert 'escapeJSON(projNote)' in applescript
+
+    def test_get_projects_note_limit_skipped_with_query(self, client):
+        """query matches notes in Python, so notes are not truncated in AppleScript."""
+        with mock.patch('omnifocus_mcp.omnifocus_connector.run_applescript') as mock_run:
+            mock_run.return_value = '[]'
+
+            client.get_projects(note_limit=100, query="test")
+
+            applescript = mock_run.call_args[0][0]
+            assert 'thru 100 of projNote' not in applescript
+
+    def test_get_projects_no_note_limit_by_default(self, client):
+        """Without note_limit, full notes are returned."""
+        with mock.patch('omnifocus_mcp.omnifocus_connector.run_applescript') as mock_run:
+            mock_run.return_value = '[]'
+
+            client.get_projects()
+
+            applescript = mock_run.call_args[0][0]
+            assert 'of projNote' not in applescript
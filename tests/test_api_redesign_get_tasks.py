@@ -197,3 +197,20 @@ class TestGetTasksEnhancements:
             client.get_tasks(project_id="proj-001", flagged_only=True)
 
             assert mock_run.called
+
+    def test_get_tasks_note_limit_truncates_in_applescript(self, client):
+        """note_limit truncates notes inside AppleScript before JSON encoding."""
+        with mock.patch('omnifocus_mcp.omnifocus_connector.run_applescript') as mock_run:
+            mock_run.return_value = '[]'
+            client.get_tasks(note_limit=100, query="test")
+            script = mock_run.call_args[0][0]
+            assert 'text 1 thru 100 of taskNote' in script
+            assert 'escapeJSON(taskNote)' in script
+
+    def test_get_tasks_no_note_limit_by_default(self, client):
+        """Without note_limit, full notes are returned."""
+        with mock.patch('omnifocus_mcp.omnifocus_connector.run_applescript') as mock_run:
+            mock_run.return_value = '[]'
+            client.get_tasks()
+            script = mock_run.call_args[0][0]
+            assert 'thru' not in script
@@ -587,6 +587,36 @@ class TestUpdateTasksRedesign:
             assert result["updated_count"] == 2
             assert result["failed_count"] == 1
 
+    def test_update_tasks_reports_which_ids_failed(self, client):
+        """update_tasks() names the failed IDs the batch script reports."""
+        with mock.patch('omnifocus_mcp.omnifocus_connector.run_applescript') as mock_run:
+            # First line: success count; following lines: failed IDs
+            mock_run.return_value = "2\ntask-invalid\n"
+
+            result = client.update_tasks(
+                ["task-001", "task-invalid", "task-003"],
+                add_tags=["urgent"]
+            )
+
+            assert result["updated_ids"] == ["task-001", "task-003"]
+            assert result["failures"] == [
+                {"task_id": "task-invalid", "error": "Task not found or update failed"}
+            ]
+            script = mock_run.call_args[0][0]
+            assert "set end of failedIds to (contents of taskId)" in script
+
+    def test_update_tasks_bulk_reports_unmatched_ids(self, client):
+        """Bulk-only updates compare requested IDs with the IDs actually matched."""
+        with mock.patch('omnifocus_mcp.omnifocus_connector.run_applescript') as mock_run:
+            mock_run.return_value = "1\ntask-gone"
+
+            result = client.update_tasks(["task-gone", "task-002"], flagged=True)
+
+            assert result["updated_ids"] == ["task-002"]
+            assert result["failed_count"] == 1
+            script = mock_run.call_args[0][0]
+            assert "set foundIds to id of (every flattened task whose" in script
+
     # ========================================================================
     # Validation
     # ========================================================================
@@ -32,7 +32,7 @@ import pytest
 # Import the MCP server tools
 import omnifocus_mcp.server_fastmcp as server
 
-# Extract tool functions (FastMCP @mcp.tool() returns the function directly)
+# Extract tool functions (@_tool() returns the sync function directly)
 create_task = server.create_task
 create_tasks = server.create_tasks
 update_task = server.update_task
@@ -234,6 +234,39 @@ class TestOmniFocusConnector:
             project_id = client.create_project("")
             assert project_id == "proj-new-001"
 
+    def test_set_autosave_returns_previous_value(self, client):
+        """Test set_autosave disables autosave and reports the prior setting."""
+        with mock.patch('omnifocus_mcp.omnifocus_connector.run_applescript') as mock_run:
+            mock_run.return_value = "true"
+            previous = client.set_autosave(False)
+
+            assert previous is True
+            script = mock_run.call_args[0][0]
+            assert "set will autosave to false" in script
+            assert "synchronize" not in script
+
+    def test_set_autosave_enable_requests_sync(self, client):
+        """Test re-enabling autosave also requests one sync."""
+        with mock.patch('omnifocus_mcp.omnifocus_connector.run_applescript') as mock_run:
+            mock_run.return_value = "false"
+            previous = client.set_autosave(True)
+
+            assert previous is False
+            script = mock_run.call_args[0][0]
+            assert "set will autosave to true" in script
+            assert "synchronize" in script
+
+    def test_restore_autosave_only_when_running_and_off(self, client):
+        """Test restore_autosave re-enables autosave without launching OmniFocus."""
+        with mock.patch('omnifocus_mcp.omnifocus_connector.run_applescript') as mock_run:
+            mock_run.return_value = "restored"
+            restored = client.restore_autosave()
+
+            assert restored is True
+            script = mock_run.call_args[0][0]
+            assert script.index('if application "OmniFocus" is running') < script.index('tell application "OmniFocus"')
+            assert "if not will autosave then" in script
+
 
 class TestGetTasks:
     """Tests for get_tasks functionality."""
@@ -1782,7 +1815,8 @@ class TestBatchUpdateTasks:
             script = mock_run.call_args[0][0]
             assert 'whose id is "t1" or id is "t2" or id is "t3"' in script
             assert "flagged" in script
-            assert "repeat with" not in script
+            assert 'set foundIds to id of (every flattened task whose id is "t1" or id is "t2" or id is "t3")' in script
+            assert "repeat with taskId in taskIdList" not in script  # No per-task lookups
 
     def test_bulk_estimated_minutes_uses_or_chain(self, client):
         """Batch estimated_minutes update uses OR chain for efficiency."""
@@ -1792,7 +1826,8 @@ class TestBatchUpdateTasks:
             script = mock_run.call_args[0][0]
             assert "estimated minutes" in script
             assert "30" in script
-            assert "repeat with" not in script
+            assert 'set foundIds to id of (every flattened task whose id is "t1" or id is "t2")' in script
+            assert "repeat with taskId in taskIdList" not in script  # No per-task lookups
 
     def test_bulk_due_date_uses_or_chain(self, client):
         """Batch due_date update uses OR chain without repeat loop."""
@@ -1802,7 +1837,8 @@ class TestBatchUpdateTasks:
             script = mock_run.call_args[0][0]
             assert "due date" in script
             assert "December 25, 2026" in script
-            assert "repeat with" not in script
+            assert 'set foundIds to id of (every flattened task whose id is "t1" or id is "t2")' in script
+            assert "repeat with taskId in taskIdList" not in script  # No per-task lookups
 
     def test_bulk_clear_due_date_uses_or_chain(self, client):
         """Clearing due_date in batch uses OR chain with missing value."""
@@ -1811,7 +1847,8 @@ class TestBatchUpdateTasks:
             client.update_tasks(["t1", "t2"], due_date="")
             script = mock_run.call_args[0][0]
             assert "missing value" in script
-            assert "repeat with" not in script
+            assert 'set foundIds to id of (every flattened task whose id is "t1" or id is "t2")' in script
+            assert "repeat with taskId in taskIdList" not in script  # No per-task lookups
 
     def test_bulk_defer_date_uses_or_chain(self, client):
         """Batch defer_date update uses OR chain without repeat loop."""
@@ -1820,7 +1857,8 @@ class TestBatchUpdateTasks:
             client.update_tasks(["t1", "t2"], defer_date="2026-06-01")
             script = mock_run.call_args[0][0]
             assert "defer date" in script
-            assert "repeat with" not in script
+            assert 'set foundIds to id of (every flattened task whose id is "t1" or id is "t2")' in script
+            assert "repeat with taskId in taskIdList" not in script  # No per-task lookups
 
     def test_bulk_planned_date_uses_or_chain(self, client):
         """#252: Batch planned_date uses or-chain (bulk-settable)."""
@@ -1830,7 +1868,8 @@ class TestBatchUpdateTasks:
             script = mock_run.call_args[0][0]
             assert "planned date" in script
             assert "March 15, 2026" in script
-            assert "repeat with" not in script
+            assert 'set foundIds to id of (every flattened task whose id is "t1" or id is "t2")' in script
+            assert "repeat with taskId in taskIdList" not in script  # No per-task lookups
 
     def test_bulk_mark_complete_uses_or_chain(self, client):
         """Batch mark complete uses OR chain with whose clause."""
@@ -1840,7 +1879,8 @@ class TestBatchUpdateTasks:
             script = mock_run.call_args[0][0]
             assert "mark complete" in script
             assert "whose" in script
-            assert "repeat with" not in script
+            assert 'set foundIds to id of (every flattened task whose id is "t1" or id is "t2" or id is "t3")' in script
+            assert "repeat with taskId in taskIdList" not in script  # No per-task lookups
 
     # ========================================================================
     # Per-task fields: must use repeat loop
@@ -1906,6 +1946,53 @@ class TestBatchUpdateTasks:
             assert "try" in script
             assert "on error" in script
 
+    # ========================================================================
+    # Failure reporting: failed IDs named by the script
+    # ========================================================================
+
+    def test_bulk_reports_unmatched_ids(self, client):
+        """Bulk-only update names the IDs the whose-chain did not match."""
+        with mock.patch('omnifocus_mcp.omnifocus_connector.run_applescript') as mock_run:
+            mock_run.return_value = "2\nt2"
+            result = client.update_tasks(["t1", "t2", "t3"], flagged=True)
+            script = mock_run.call_args[0][0]
+            assert "if foundIds does not contain (contents of taskId)" in script
+            assert result["updated_ids"] == ["t1", "t3"]
+            assert result["failed_count"] == 1
+            assert result["failures"] == [
+                {"task_id": "t2", "error": "Task not found or update failed"}
+            ]
+
+    def test_per_task_reports_failed_ids(self, client):
+        """Per-task loop records the IDs whose update raised."""
+        with mock.patch('omnifocus_mcp.omnifocus_connector.run_applescript') as mock_run:
+            mock_run.return_value = "1\nt1"
+            result = client.update_tasks(["t1", "t2"], project_id="proj-1")
+            script = mock_run.call_args[0][0]
+            assert "set end of failedIds to (contents of taskId)" in script
+            assert result["updated_ids"] == ["t2"]
+            assert result["failures"] == [
+                {"task_id": "t1", "error": "Task not found or update failed"}
+            ]
+
+    def test_restores_autosave_when_script_times_out(self, client):
+        """A timed-out per-task loop leaves autosave off in-script; update_tasks() restores it."""
+        timeout = subprocess.TimeoutExpired(cmd="osascript", timeout=60)
+        with mock.patch('omnifocus_mcp.omnifocus_connector.run_applescript') as mock_run:
+            mock_run.side_effect = [timeout, "restored"]
+            with pytest.raises(subprocess.TimeoutExpired):
+                client.update_tasks(["t1", "t2"], project_id="proj-1")
+            assert "set will autosave to false" in mock_run.call_args_list[0][0][0]
+            assert "set will autosave to true" in mock_run.call_args_list[1][0][0]
+
+    def test_unparseable_result_is_not_a_value_error(self, client):
+        """A malformed script result raises Exception, not the ValueError used for validation."""
+        with mock.patch('omnifocus_mcp.omnifocus_connector.run_applescript') as mock_run:
+            mock_run.return_value = "not a count"
+            with pytest.raises(Exception, match="Error parsing update result") as exc_info:
+                client.update_tasks(["t1", "t2"], flagged=True)
+            assert not isinstance(exc_info.value, ValueError)
+
 
 class TestBatchUpdateProjects:
     """Tests for batched update_projects() — or-chain optimization (#215).
@@ -1967,7 +2054,7 @@ class TestBatchUpdateProjects:
             script = mock_run.call_args[0][0]
             assert 'whose id is "p1" or id is "p2"' in script
             assert "sequential" in script
-            assert "repeat with" not in script
+            assert "repeat with projectId in projectIdList" not in script
 
     def test_bulk_status_on_hold_uses_or_chain(self, client):
         """Batch status=on_hold uses OR chain without repeat loop."""
@@ -1977,7 +2064,7 @@ class TestBatchUpdateProjects:
             script = mock_run.call_args[0][0]
             assert "whose" in script
             assert "on hold" in script
-            assert "repeat with" not in script
+            assert "repeat with projectId in projectIdList" not in script
 
     def test_bulk_status_active_uses_or_chain(self, client):
         """Batch status=active uses OR chain without repeat loop."""
@@ -1986,7 +2073,7 @@ class TestBatchUpdateProjects:
             client.update_projects(["p1", "p2"], status="active")
             script = mock_run.call_args[0][0]
             assert "whose" in script
-            assert "repeat with" not in script
+            assert "repeat with projectId in projectIdList" not in script
 
     def test_bulk_status_done_uses_or_chain(self, client):
         """Batch status=done uses mark complete with OR chain."""
@@ -1996,7 +2083,7 @@ class TestBatchUpdateProjects:
             script = mock_run.call_args[0][0]
             assert "mark complete" in script
             assert "whose" in script
-            assert "repeat with" not in script
+            assert "repeat with projectId in projectIdList" not in script
 
     def test_bulk_review_interval_uses_or_chain(self, client):
         """Batch review_interval_weeks uses OR chain without repeat loop."""
@@ -2006,7 +2093,7 @@ class TestBatchUpdateProjects:
             script = mock_run.call_args[0][0]
             assert "review interval" in script
             assert "whose" in script
-            assert "repeat with" not in script
+            assert "repeat with projectId in projectIdList" not in script
 
     # ========================================================================
     # Per-project fields: must use repeat loop
@@ -2034,6 +2121,35 @@ class TestBatchUpdateProjects:
             assert "whose" in script  # Bulk part
             assert "repeat with" in script  # Per-project part
 
+    # ========================================================================
+    # Failure reporting: failed IDs named by the script
+    # ========================================================================
+
+    def test_bulk_reports_unmatched_ids(self, client):
+        """Bulk-only update names the IDs the whose-chain did not match."""
+        with mock.patch('omnifocus_mcp.omnifocus_connector.run_applescript') as mock_run:
+            mock_run.return_value = "1\np1"
+            result = client.update_projects(["p1", "p2"], flagged=True)
+            script = mock_run.call_args[0][0]
+            assert 'set foundIds to id of (every flattened project whose id is "p1" or id is "p2")' in script
+            assert result["updated_ids"] == ["p2"]
+            assert result["failed_count"] == 1
+            assert result["failures"] == [
+                {"project_id": "p1", "error": "Project not found or update failed"}
+            ]
+
+    def test_per_project_reports_failed_ids(self, client):
+        """Per-project loop records the IDs whose update raised."""
+        with mock.patch('omnifocus_mcp.omnifocus_connector.run_applescript') as mock_run:
+            mock_run.return_value = "1\np2"
+            result = client.update_projects(["p1", "p2"], folder_path="Work")
+            script = mock_run.call_args[0][0]
+            assert "set end of failedIds to (contents of projectId)" in script
+            assert result["updated_ids"] == ["p1"]
+            assert result["failures"] == [
+                {"project_id": "p2", "error": "Project not found or update failed"}
+            ]
+
 
 class TestBuildWhoseOrChain:
     """Tests for _build_whose_or_chain() helper."""
@@ -52,6 +52,28 @@ class TestSafetyGuardsWithTestMode:
             first_call_script = mock_run.call_args_list[0][0][0]
             assert "name of it" in first_call_script  # Database name check
 
+    def test_invalid_arguments_rejected_before_database_check(self, client_with_test_mode):
+        """Test that argument errors are raised without any AppleScript round-trip."""
+        with mock.patch('omnifocus_mcp.omnifocus_connector.run_applescript') as mock_run:
+            with pytest.raises(ValueError):
+                client_with_test_mode.create_task("Task", project_id="proj-001", parent_task_id="task-001")
+            with pytest.raises(ValueError):
+                client_with_test_mode.update_task("task-001", tags=["A"], add_tags=["B"])
+            with pytest.raises(ValueError):
+                client_with_test_mode.update_tasks(["task-001"], project_id="proj-001", parent_task_id="task-002")
+            with pytest.raises(ValueError):
+                client_with_test_mode.reorder_task("task-001")
+            with pytest.raises(ValueError):
+                client_with_test_mode.reorder_project("proj-001", before_project_id="proj-002", after_project_id="proj-003")
+            with pytest.raises(ValueError):
+                client_with_test_mode.delete_tasks([])
+            with pytest.raises(ValueError):
+                client_with_test_mode.update_project("proj-001")
+            with pytest.raises(ValueError):
+                client_with_test_mode.update_projects(["proj-001"], note="Shared")
+
+            mock_run.assert_not_called()
+
     def test_add_task_blocked_if_wrong_database(self, client_with_test_mode):
         """Test that create_task is blocked if database name doesn't match."""
         with mock.patch('omnifocus_mcp.omnifocus_connector.run_applescript') as mock_run:
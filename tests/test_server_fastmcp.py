@@ -1,11 +1,18 @@
 """Tests for FastMCP server."""
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
+from fastmcp import Client
 from unittest import mock
 
 # Import the server module to access tool functions
 import omnifocus_mcp.server_fastmcp as server
 
-# Extract tool functions (FastMCP @mcp.tool() returns the function directly)
+# Extract tool functions (@_tool() returns the sync function directly)
 get_client = server.get_client
 get_projects = server.get_projects
 create_project = server.create_project
@@ -28,8 +35,10 @@ def reset_client():
     """Reset the global client before each test."""
     import omnifocus_mcp.server_fastmcp as server_module
     server_module._client = None
+    server_module._read_cache.clear()
     yield
     server_module._client = None
+    server_module._read_cache.clear()
 
 
 class TestGetClient:
@@ -46,6 +55,13 @@ class TestGetClient:
         client2 = get_client()
         assert client1 is client2
 
+    def test_get_client_shared_across_threads(self):
+        """Test that concurrent first calls from worker threads share one client."""
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            clients = list(pool.map(lambda _: get_client(), range(16)))
+        assert all(c is clients[0] for c in clients)
+
     def test_get_client_disables_safety_in_pytest(self):
         """Test that safety checks are disabled when running in pytest."""
         import os
@@ -55,6 +71,388 @@ class TestGetClient:
         del os.environ['PYTEST_CURRENT_TEST']
 
 
+class TestToolRegistration:
+    """Tests for how tools are registered with FastMCP."""
+
+    def test_all_tools_registered(self):
+        """Test that every @_tool() function is exposed over MCP."""
+        tools = asyncio.run(server.mcp.list_tools())
+        names = {t.name for t in tools}
+        assert len(names) == 21
+        assert {"get_tasks", "update_tasks", "delete_projects"} <= names
+
+    def test_tool_calls_run_off_event_loop(self):
+        """Test that concurrent tool calls overlap instead of blocking the loop."""
+        # Each call waits until all three are running at once; calls run one
+        # at a time on the loop would break the barrier instead
+        all_running = threading.Barrier(3, timeout=5)
+
+        def slow_get_tasks(**kwargs):
+            all_running.wait()
+            return [{"id": kwargs["task_id"], "name": "Task", "completed": False}]
+
+        async def call_concurrently():
+            async with Client(server.mcp) as mcp_client:
+                return await asyncio.gather(*[
+                    mcp_client.call_tool("get_tasks", {"task_id": f"task-{i}"}) for i in range(3)
+                ])
+
+        with mock.patch('omnifocus_mcp.server_fastmcp.get_client') as mock_get_client:
+            mock_client = mock.Mock()
+            mock_client.get_tasks.side_effect = slow_get_tasks
+            mock_get_client.return_value = mock_client
+
+            results = asyncio.run(call_concurrently())
+
+        assert all("Found 1 tasks" in r.content[0].text for r in results)
+        assert mock_client.get_tasks.call_count == 3
+        assert not all_running.broken
+
+    def test_concurrent_writes_run_one_at_a_time(self):
+        """Test that write tools never overlap, even when called concurrently."""
+        active = []
+        overlaps = []
+
+        def slow_create_tag(**kwargs):
+            active.append(1)
+            if len(active) > 1:
+                overlaps.append(1)
+            time.sleep(0.05)
+            active.pop()
+            return f"tag-{kwargs['name']}"
+
+        async def call_concurrently():
+            async with Client(server.mcp) as mcp_client:
+                return await asyncio.gather(*[
+                    mcp_client.call_tool("create_tags", {"tags": [{"name": f"T{i}"}]})
+                    for i in range(3)
+                ])
+
+        with mock.patch('omnifocus_mcp.server_fastmcp.get_client') as mock_get_client:
+            mock_client = mock.Mock()
+            mock_client.create_tag.side_effect = slow_create_tag
+            mock_get_client.return_value = mock_client
+
+            asyncio.run(call_concurrently())
+
+        assert mock_client.create_tag.call_count == 3
+        assert overlaps == []
+
+    def test_queued_writes_do_not_hold_worker_threads(self):
+        """Test that a read runs while writes wait, even with few worker threads."""
+        events = []
+        write_started = threading.Event()
+        release_writes = threading.Event()
+
+        def blocked_create_tag(**kwargs):
+            events.append("write-start")
+            write_started.set()
+            release_writes.wait(timeout=5)
+            events.append("write-end")
+            return f"tag-{kwargs['name']}"
+
+        def get_tags():
+            events.append("read")
+            return []
+
+        async def writes_then_read():
+            asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=2))
+            async with Client(server.mcp) as mcp_client:
+                writes = [
+                    asyncio.ensure_future(
+                        mcp_client.call_tool("create_tags", {"tags": [{"name": f"T{i}"}]})
+                    )
+                    for i in range(3)
+                ]
+                try:
+                    while not write_started.is_set():
+                        await asyncio.sleep(0.01)
+                    await asyncio.sleep(0)  # Let the other writes queue up
+                    # Two threads: one runs the blocked write. A queued writer
+                    # parked on the other would leave the read no thread.
+                    await asyncio.wait_for(mcp_client.call_tool("get_tags", {}), timeout=5)
+                finally:
+                    release_writes.set()
+                await asyncio.gather(*writes)
+
+        with mock.patch('omnifocus_mcp.server_fastmcp.get_client') as mock_get_client:
+            mock_client = mock.Mock()
+            mock_client.create_tag.side_effect = blocked_create_tag
+            mock_client.get_tags.side_effect = get_tags
+            mock_get_client.return_value = mock_client
+
+            asyncio.run(writes_then_read())
+
+        # The read ran while the first write was still blocked
+        assert events[:3] == ["write-start", "read", "write-end"]
+        assert events.count("write-end") == 3
+
+    def test_identical_concurrent_reads_coalesced(self):
+        """Test that overlapping identical read calls share one execution."""
+        def slow_get_tags():
+            time.sleep(0.2)
+            return [{"id": "tag-001", "name": "Work", "status": "active"}]
+
+        async def call_concurrently():
+            async with Client(server.mcp) as mcp_client:
+                return await asyncio.gather(*[
+                    mcp_client.call_tool("get_tags", {}) for _ in range(3)
+                ])
+
+        with mock.patch('omnifocus_mcp.server_fastmcp.get_client') as mock_get_client:
+            mock_client = mock.Mock()
+            mock_client.get_tags.side_effect = slow_get_tags
+            mock_get_client.return_value = mock_client
+
+            results = asyncio.run(call_concurrently())
+
+        assert all("Found 1 tags" in r.content[0].text for r in results)
+        mock_client.get_tags.assert_called_once()
+        assert server._inflight == {}
+
+    def test_single_flight_propagates_errors_to_waiters(self):
+        """Test that a failing leader call fails every coalesced waiter."""
+        calls = []
+
+        async def failing():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            raise RuntimeError("boom")
+
+        async def run_all():
+            return await asyncio.gather(
+                *[server._single_flight("k", failing) for _ in range(3)],
+                return_exceptions=True,
+            )
+
+        results = asyncio.run(run_all())
+
+        assert len(calls) == 1
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert server._inflight == {}
+
+    def test_single_flight_survives_leader_cancellation(self):
+        """Test that cancelling the first caller does not cancel coalesced waiters."""
+        calls = []
+
+        async def slow():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return "result"
+
+        async def cancel_leader():
+            leader = asyncio.ensure_future(server._single_flight("k", slow))
+            await asyncio.sleep(0)
+            waiter = asyncio.ensure_future(server._single_flight("k", slow))
+            await asyncio.sleep(0)
+            leader.cancel()
+            return await waiter, leader.cancelled()
+
+        result, leader_cancelled = asyncio.run(cancel_leader())
+
+        assert result == "result"
+        assert leader_cancelled
+        assert len(calls) == 1
+        assert server._inflight == {}
+
+    def test_read_after_write_does_not_join_earlier_read(self):
+        """Test that a read issued after a write runs again instead of sharing a pre-write read."""
+        def slow_get_tags():
+            time.sleep(0.2)
+            return [{"id": "tag-001", "name": "Work", "status": "active"}]
+
+        async def read_write_read():
+            async with Client(server.mcp) as mcp_client:
+                first = asyncio.ensure_future(mcp_client.call_tool("get_tags", {}))
+                await asyncio.sleep(0.05)
+                await mcp_client.call_tool("create_tags", {"tags": [{"name": "Home"}]})
+                await asyncio.gather(first, mcp_client.call_tool("get_tags", {}))
+
+        with mock.patch('omnifocus_mcp.server_fastmcp.get_client') as mock_get_client:
+            mock_client = mock.Mock()
+            mock_client.get_tags.side_effect = slow_get_tags
+            mock_client.create_tag.return_value = "tag-002"
+            mock_get_client.return_value = mock_client
+
+            asyncio.run(read_write_read())
+
+        assert mock_client.get_tags.call_count == 2
+
+    def test_repeated_reads_served_from_cache(self):
+        """Test that an identical read within the TTL skips the backend."""
+        async def call_twice():
+            async with Client(server.mcp) as mcp_client:
+                first = await mcp_client.call_tool("get_tags", {})
+                second = await mcp_client.call_tool("get_tags", {})
+                return first, second
+
+        with mock.patch('omnifocus_mcp.server_fastmcp.get_client') as mock_get_client:
+            mock_client = mock.Mock()
+            mock_client.get_tags.return_value = [{"id": "tag-001", "name": "Work", "status": "active"}]
+            mock_get_client.return_value = mock_client
+
+            first, second = asyncio.run(call_twice())
+
+        assert first.content[0].text == second.content[0].text
+        mock_client.get_tags.assert_called_once()
+
+    def test_write_invalidates_cached_reads(self):
+        """Test that a write tool call discards cached read results."""
+        async def read_write_read():
+            async with Client(server.mcp) as mcp_client:
+                await mcp_client.call_tool("get_tags", {})
+                await mcp_client.call_tool("create_tags", {"tags": [{"name": "Home"}]})
+                return await mcp_client.call_tool("get_tags", {})
+
+        with mock.patch('omnifocus_mcp.server_fastmcp.get_client') as mock_get_client:
+            mock_client = mock.Mock()
+            mock_client.get_tags.side_effect = [
+                [{"id": "tag-001", "name": "Work", "status": "active"}],
+                [{"id": "tag-001", "name": "Work", "status": "active"},
+                 {"id": "tag-002", "name": "Home", "status": "active"}],
+            ]
+            mock_client.create_tag.return_value = "tag-002"
+            mock_get_client.return_value = mock_client
+
+            result = asyncio.run(read_write_read())
+
+        assert "Found 2 tags" in result.content[0].text
+        assert mock_client.get_tags.call_count == 2
+
+    def test_folders_and_perspectives_cached(self):
+        """Test that folder and perspective listings are cached reads too."""
+        async def call_each_twice():
+            async with Client(server.mcp) as mcp_client:
+                for tool in ("get_folders", "get_perspectives"):
+                    await mcp_client.call_tool(tool, {})
+                    await mcp_client.call_tool(tool, {})
+
+        with mock.patch('omnifocus_mcp.server_fastmcp.get_client') as mock_get_client:
+            mock_client = mock.Mock()
+            mock_client.get_folders.return_value = [{"id": "fold-001", "name": "Work", "path": "Work"}]
+            mock_client.get_perspectives.return_value = [{"name": "Inbox", "type": "built-in"}]
+            mock_get_client.return_value = mock_client
+
+            asyncio.run(call_each_twice())
+
+        mock_client.get_folders.assert_called_once()
+        mock_client.get_perspectives.assert_called_once()
+
+    def test_task_write_keeps_unrelated_cached_reads(self):
+        """Test that a task write only invalidates the reads it can change."""
+        async def read_write_read():
+            async with Client(server.mcp) as mcp_client:
+                await mcp_client.call_tool("get_tags", {})
+                await mcp_client.call_tool("get_projects", {})
+                await mcp_client.call_tool("create_tasks", {"tasks": [{"task_name": "New"}]})
+                await mcp_client.call_tool("get_tags", {})
+                await mcp_client.call_tool("get_projects", {})
+
+        with mock.patch('omnifocus_mcp.server_fastmcp.get_client') as mock_get_client:
+            mock_client = mock.Mock()
+            mock_client.get_tags.return_value = [{"id": "tag-001", "name": "Work", "status": "active"}]
+            mock_client.get_projects.return_value = [{"id": "proj-001", "name": "Home", "status": "active status"}]
+            mock_client.create_task.return_value = "task-001"
+            mock_get_client.return_value = mock_client
+
+            asyncio.run(read_write_read())
+
+        mock_client.get_tags.assert_called_once()
+        assert mock_client.get_projects.call_count == 2
+
+    def test_cached_reads_expire(self):
+        """Test that cached results are not reused after the TTL."""
+        async def call_twice():
+            async with Client(server.mcp) as mcp_client:
+                await mcp_client.call_tool("get_tags", {})
+                await mcp_client.call_tool("get_tags", {})
+
+        with mock.patch('omnifocus_mcp.server_fastmcp.get_client') as mock_get_client, \
+                mock.patch.object(server, 'READ_CACHE_TTL_SECONDS', 0):
+            mock_client = mock.Mock()
+            mock_client.get_tags.return_value = [{"id": "tag-001", "name": "Work", "status": "active"}]
+            mock_get_client.return_value = mock_client
+
+            asyncio.run(call_twice())
+
+        assert mock_client.get_tags.call_count == 2
+
+
+class TestLoggingConfiguration:
+    """Tests for opt-in file logging."""
+
+    def test_package_logger_silent_by_default(self):
+        """Test that the package logger only has a NullHandler without the env var."""
+        handlers = logging.getLogger("omnifocus_mcp").handlers
+        assert any(isinstance(h, logging.NullHandler) for h in handlers)
+        assert not any(isinstance(h, logging.FileHandler) for h in handlers)
+
+    def test_log_env_var_routes_to_file(self, tmp_path, monkeypatch):
+        """Test that OMNIFOCUS_MCP_LOG attaches a file handler to the package logger."""
+        log_file = tmp_path / "server.log"
+        monkeypatch.setenv("OMNIFOCUS_MCP_LOG", str(log_file))
+        package_logger = logging.getLogger("omnifocus_mcp")
+        original_level = package_logger.level
+
+        server._configure_logging()
+        try:
+            logging.getLogger("omnifocus_mcp.omnifocus_connector").warning("retrying")
+        finally:
+            for h in package_logger.handlers[:]:
+                if isinstance(h, logging.FileHandler):
+                    h.close()
+                    package_logger.removeHandler(h)
+            package_logger.setLevel(original_level)
+
+        assert "WARNING omnifocus_mcp.omnifocus_connector: retrying" in log_file.read_text()
+
+    def test_unwritable_log_file_warns_and_continues(self, tmp_path, monkeypatch, capsys):
+        """Test that a log path that cannot be opened is reported on stderr, not raised."""
+        monkeypatch.setenv("OMNIFOCUS_MCP_LOG", str(tmp_path / "missing-dir" / "server.log"))
+
+        server._configure_logging()
+
+        assert "continuing without file logging" in capsys.readouterr().err
+        handlers = logging.getLogger("omnifocus_mcp").handlers
+        assert not any(isinstance(h, logging.FileHandler) for h in handlers)
+
+    def test_main_configures_logging_before_running(self):
+        """Test that logging is set up by the entry point rather than at import."""
+        with mock.patch.object(server, '_configure_logging') as mock_configure, \
+                mock.patch.object(server, '_restore_autosave'), \
+                mock.patch.object(server.mcp, 'run') as mock_run:
+            server.main()
+
+        mock_configure.assert_called_once_with()
+        mock_run.assert_called_once_with()
+
+    def test_main_restores_autosave_left_off(self):
+        """Test that startup re-enables autosave an interrupted batch left off."""
+        with mock.patch('omnifocus_mcp.server_fastmcp.get_client') as mock_get_client, \
+                mock.patch.object(server, '_configure_logging'), \
+                mock.patch.object(server.mcp, 'run'):
+            mock_client = mock.Mock()
+            mock_client.restore_autosave.return_value = True
+            mock_get_client.return_value = mock_client
+
+            server.main()
+
+        mock_client.restore_autosave.assert_called_once_with()
+
+    def test_main_starts_when_autosave_check_fails(self):
+        """Test that an autosave check error is logged and the server still runs."""
+        with mock.patch('omnifocus_mcp.server_fastmcp.get_client') as mock_get_client, \
+                mock.patch.object(server, '_configure_logging'), \
+                mock.patch.object(server.mcp, 'run') as mock_run:
+            mock_client = mock.Mock()
+            mock_client.restore_autosave.side_effect = Exception("no document")
+            mock_get_client.return_value = mock_client
+
+            server.main()
+
+        mock_run.assert_called_once_with()
+
+
 class TestProjectTools:
     """Tests for project-related tools."""
 
@@ -196,6 +594,7 @@ class TestTaskTools:
                 task_id=None,  # NEW (Phase 3.1)
                 parent_task_id=None,  # NEW (Phase 3.1)
                 include_full_notes=False,  # NEW (Phase 3.1)
+                note_limit=100,
                 project_id="proj-001",
                 flagged_only=True,
                 include_completed=False,
@@ -254,6 +653,7 @@ class TestTaskTools:
                 task_id=None,  # NEW (Phase 3.1)
                 parent_task_id=None,  # NEW (Phase 3.1)
                 include_full_notes=False,  # NEW (Phase 3.1)
+                note_limit=100,
                 project_id=None,
                 flagged_only=False,
                 include_completed=False,
@@ -367,6 +767,19 @@ class TestFolderTools:
             assert "Found 1 folders" in result
             assert "Work" in result
 
+    def test_get_folders_json_response_format(self):
+        """Test get_folders with response_format="json"."""
+        with mock.patch('omnifocus_mcp.server_fastmcp.get_client') as mock_get_client:
+            mock_client = mock.Mock()
+            mock_client.get_folders.return_value = [
+                {"id": "folder-001", "name": "Work", "path": "Work"}
+            ]
+            mock_get_client.return_value = mock_client
+
+            result = get_folders(response_format="json")
+
+            assert result == '{"count":1,"items":[{"id":"folder-001","name":"Work","path":"Work"}]}'
+
     def test_create_folder_success(self):
         """Test create_folder with success."""
         with mock.patch('omnifocus_mcp.server_fastmcp.get_client') as mock_get_client:
@@ -732,6 +1145,21 @@ class TestTagTools:
             assert "Found 1 tags" in result
             assert "urgent" in result
 
+    def test_get_tags_json_response_format(self):
+        """Test get_tags with response_format="json"."""
+        mock_tags = [
+            {"id": "tag-001", "name": "urgent", "status": "active"}
+        ]
+
+        with mock.patch('omnifocus_mcp.server_fastmcp.get_client') as mock_get_client:
+            mock_client = mock.Mock()
+            mock_client.get_tags.return_value = mock_tags
+            mock_get_client.return_value = mock_client
+
+            result = get_tags(response_format="json")
+
+            assert result == '{"count":1,"items":[{"id":"tag-001","name":"urgent","status":"active"}]}'
+
 
 class TestBatchOperationTools:
     """Tests for batch operation MCP tools."""
@@ -243,6 +243,20 @@ class TestCreateTasksUnified:
             assert "3" in result
             assert mock_client.create_task.call_count == 3
 
+    def test_create_tasks_batch_suspends_autosave(self):
+        """Multi-item creates disable autosave around the loop and restore it after."""
+        with mock.patch('omnifocus_mcp.server_fastmcp.get_client') as mock_get_client:
+            mock_client = mock.Mock()
+            mock_client.set_autosave.return_value = True
+            mock_client.create_task.side_effect = ["task-001", "task-002"]
+            mock_get_client.return_value = mock_client
+
+            server.create_tasks(tasks=[{"task_name": "Task A"}, {"task_name": "Task B"}])
+
+            calls = [c[0] for c in mock_client.method_calls]
+            assert calls == ["set_autosave", "create_task", "create_task", "set_autosave"]
+            assert mock_client.set_autosave.call_args_list == [mock.call(False), mock.call(True)]
+
     def test_create_tasks_partial_failure(self):
         """create_tasks with one failure returns mixed results."""
         with mock.patch('omnifocus_mcp.server_fastmcp.get_client') as mock_get_client:
@@ -35,8 +35,22 @@ class TestGetProjectsServerEnhancements:
             # Verify include_full_notes was passed correctly
             call_kwargs = mock_client.get_projects.call_args[1]
             assert call_kwargs['include_full_notes'] is True
+            assert call_kwargs['note_limit'] is None
             assert isinstance(result, str)
 
+
+    def test_get_projects_truncates_notes_in_client_by_default(self):
+        """Server: get_projects() asks the client to truncate notes at preview length."""
+        with mock.patch('omnifocus_mcp.server_fastmcp.get_client') as mock_get_client:
+            mock_client = mock.Mock()
+            mock_client.get_projects.return_value = []
+            mock_get_client.return_value = mock_client
+
+            server.get_projects()
+
+            call_kwargs = mock_client.get_projects.call_args[1]
+            assert call_kwargs['note_limit'] == server.NOTE_TRUNCATION_LENGTH
+
     def test_get_projects_handles_value_error(self):
         """Server: get_projects() catches ValueError and returns error string."""
         with mock.patch('omnifocus_mcp.server_fastmcp.get_client') as mock_get_client:
@@ -109,3 +123,38 @@ class TestGetProjectsServerEnhancements:
             assert call_kwargs['completed_only'] is True
             assert isinstance(result, str)
             assert "completed projects" in result.lower()
+
+    def test_get_projects_limit_formats_one_page(self):
+        """Server: get_projects(limit) formats only the first page."""
+        with mock.patch('omnifocus_mcp.server_fastmcp.get_client') as mock_get_client:
+            mock_client = mock.Mock()
+            mock_client.get_projects.return_value = [
+                {"id": f"proj-{i}", "name": f"Project {i}", "status": "active"}
+                for i in range(3)
+            ]
+            mock_get_client.return_value = mock_client
+
+            result = server.get_projects(limit=2)
+
+            assert result.startswith("Found 3 active projects (showing 1-2):")
+            assert "proj-1" in result
+            assert "proj-2" not in result
+
+    def test_get_projects_rejects_negative_offset(self):
+        """Server: negative offset returns an error without querying."""
+        with mock.patch('omnifocus_mcp.server_fastmcp.get_client') as mock_get_client:
+            result = server.get_projects(offset=-1)
+
+            assert result.startswith("Error: offset must be non-negative")
+            mock_get_client.assert_not_called()
+
+    def test_get_projects_json_response_format(self):
+        """Server: response_format="json" returns compact JSON, even when empty."""
+        with mock.patch('omnifocus_mcp.server_fastmcp.get_client') as mock_get_client:
+            mock_client = mock.Mock()
+            mock_client.get_projects.return_value = []
+            mock_get_client.return_value = mock_client
+
+            result = server.get_projects(response_format="json")
+
+            assert result == '{"count":0,"items":[]}'
@@ -1,4 +1,5 @@
 """Server tests for get_tasks() enhancements (Phase 3.1)."""
+import json
 from unittest import mock
 import omnifocus_mcp.server_fastmcp as server
 
@@ -48,8 +49,22 @@ class TestGetTasksServerEnhancements:
             # Verify include_full_notes was passed correctly
             call_kwargs = mock_client.get_tasks.call_args[1]
             assert call_kwargs['include_full_notes'] is True
+            assert call_kwargs['note_limit'] is None
             assert isinstance(result, str)
 
+
+    def test_get_tasks_truncates_notes_in_client_by_default(self):
+        """Server: get_tasks() asks the client to truncate notes at preview length."""
+        with mock.patch('omnifocus_mcp.server_fastmcp.get_client') as mock_get_client:
+            mock_client = mock.Mock()
+            mock_client.get_tasks.return_value = []
+            mock_get_client.return_value = mock_client
+
+            server.get_tasks()
+
+            call_kwargs = mock_client.get_tasks.call_args[1]
+            assert call_kwargs['note_limit'] == server.NOTE_TRUNCATION_LENGTH
+
     def test_get_tasks_handles_value_error(self):
         """Server: get_tasks() catches ValueError and returns error string."""
         with mock.patch('omnifocus_mcp.server_fastmcp.get_client') as mock_get_client:
@@ -61,3 +76,65 @@ class TestGetTasksServerEnhancements:
             assert isinstance(result, str)
             assert "error" in result.lower()
             assert "invalid date filter" in result.lower()
+
+    def test_get_tasks_limit_offset_formats_one_page(self):
+        """Server: get_tasks(limit, offset) formats only the requested page."""
+        with mock.patch('omnifocus_mcp.server_fastmcp.get_client') as mock_get_client:
+            mock_client = mock.Mock()
+            mock_client.get_tasks.return_value = [
+                {"id": f"task-{i}", "name": f"Task {i}", "completed": False}
+                for i in range(5)
+            ]
+            mock_get_client.return_value = mock_client
+
+            result = server.get_tasks(limit=2, offset=1)
+
+            assert result.startswith("Found 5 tasks (showing 2-3):")
+            assert "task-1" in result and "task-2" in result
+            assert "task-0" not in result and "task-3" not in result
+
+    def test_get_tasks_offset_past_end(self):
+        """Server: an offset past the end reports an empty page."""
+        with mock.patch('omnifocus_mcp.server_fastmcp.get_client') as mock_get_client:
+            mock_client = mock.Mock()
+            mock_client.get_tasks.return_value = [
+                {"id": "task-0", "name": "Task 0", "completed": False}
+            ]
+            mock_get_client.return_value = mock_client
+
+            result = server.get_tasks(offset=5)
+
+            assert result == "Found 1 tasks (none at offset 5):\n\n"
+
+    def test_get_tasks_rejects_invalid_limit(self):
+        """Server: non-positive limit returns an error without querying."""
+        with mock.patch('omnifocus_mcp.server_fastmcp.get_client') as mock_get_client:
+            result = server.get_tasks(limit=0)
+
+            assert result.startswith("Error: limit must be a positive integer")
+            mock_get_client.assert_not_called()
+
+    def test_get_tasks_json_response_format(self):
+        """Server: response_format="json" returns the page of raw task dicts."""
+        with mock.patch('omnifocus_mcp.server_fastmcp.get_client') as mock_get_client:
+            mock_client = mock.Mock()
+            mock_client.get_tasks.return_value = [
+                {"id": f"task-{i}", "name": f"Task {i}", "completed": False, "note": "x" * 150}
+                for i in range(3)
+            ]
+            mock_get_client.return_value = mock_client
+
+            result = server.get_tasks(limit=2, query="Task", response_format="json")
+
+            data = json.loads(result)
+            assert data["count"] == 3
+            assert [t["id"] for t in data["items"]] == ["task-0", "task-1"]
+            assert data["items"][0]["note"] == "x" * 100 + "..."
+
+    def test_get_tasks_rejects_unknown_response_format(self):
+        """Server: an unknown response_format returns an error without querying."""
+        with mock.patch('omnifocus_mcp.server_fastmcp.get_client') as mock_get_client:
+            result = server.get_tasks(response_format="xml")
+
+            assert result.startswith("Error: response_format must be 'text' or 'json'")
+            mock_get_client.assert_not_called()
@@ -9,7 +9,7 @@ from unittest import mock
 # Import server module
 import omnifocus_mcp.server_fastmcp as server
 
-# Extract tool functions (FastMCP @mcp.tool() returns the function directly)
+# Extract tool functions (@_tool() returns the sync function directly)
 update_task = server.update_task
 update_tasks = server.update_tasks
 TaskUpdate = server.TaskUpdate
@@ -283,7 +283,8 @@ class TestUpdateTasksServerRedesign:
     """Tests for update_tasks() MCP tool (batch operations via unified API).
 
     The unified update_tasks accepts list[TaskUpdate] and iterates over them,
-    calling client.update_task for each item individually.
+    calling client.update_task for each item individually, except that items
+    setting identical uniform fields share one client.update_tasks call.
     """
 
     # ========================================================================
@@ -311,14 +312,12 @@ class TestUpdateTasksServerRedesign:
             assert "Successfully" in result
 
     def test_update_tasks_multiple_ids_same_value(self):
-        """Unified API: Multiple tasks with same flagged value."""
+        """Unified API: Multiple tasks with same flagged value go through one batch call."""
         with mock.patch('omnifocus_mcp.server_fastmcp.get_client') as mock_get_client:
             mock_client = mock.Mock()
-            mock_client.update_task.return_value = {
-                "success": True,
-                "task_id": "any",
-                "updated_fields": ["flagged"],
-                "error": None,
+            mock_client.update_tasks.return_value = {
+                "updated_count": 3, "failed_count": 0,
+                "updated_ids": ["task-001", "task-002", "task-003"], "failures": [],
             }
             mock_get_client.return_value = mock_client
 
@@ -328,28 +327,207 @@ class TestUpdateTasksServerRedesign:
                 {"id": "task-003", "flagged": True},
             ])
 
-            assert mock_client.update_task.call_count == 3
+            mock_client.update_tasks.assert_called_once_with(
+                ["task-001", "task-002", "task-003"], flagged=True
+            )
+            mock_client.update_task.assert_not_called()
             assert "3 of 3 tasks" in result
 
-    def test_update_tasks_batch_with_flagged(self):
-        """Unified API: Flagged parameter passed through for each task."""
+    def test_update_tasks_batch_suspends_autosave(self):
+        """Multi-item batches disable autosave before the loop and restore it after."""
         with mock.patch('omnifocus_mcp.server_fastmcp.get_client') as mock_get_client:
             mock_client = mock.Mock()
+            mock_client.set_autosave.return_value = True
             mock_client.update_task.return_value = {
-                "success": True,
-                "task_id": "any",
-                "updated_fields": ["flagged"],
-                "error": None,
+                "success": True, "task_id": "any", "updated_fields": ["flagged"], "error": None,
+            }
+            mock_get_client.return_value = mock_client
+
+            update_tasks([
+                {"id": "task-001", "task_name": "First"},
+                {"id": "task-002", "task_name": "Second"},
+            ])
+
+            calls = [c[0] for c in mock_client.method_calls]
+            assert calls == ["set_autosave", "update_task", "update_task", "set_autosave"]
+            assert mock_client.set_autosave.call_args_list == [mock.call(False), mock.call(True)]
+
+    def test_update_tasks_single_item_leaves_autosave_alone(self):
+        """Single-item updates skip the autosave round-trips."""
+        with mock.patch('omnifocus_mcp.server_fastmcp.get_client') as mock_get_client:
+            mock_client = mock.Mock()
+            mock_client.update_task.return_value = {
+                "success": True, "task_id": "task-001", "updated_fields": ["flagged"], "error": None,
+            }
+            mock_get_client.return_value = mock_client
+
+            update_tasks([{"id": "task-001", "flagged": True}])
+
+            mock_client.set_autosave.assert_not_called()
+
+    def test_update_tasks_autosave_failure_does_not_fail_batch(self):
+        """An autosave toggle error is logged, and the batch still runs."""
+        with mock.patch('omnifocus_mcp.server_fastmcp.get_client') as mock_get_client:
+            mock_client = mock.Mock()
+            mock_client.set_autosave.side_effect = Exception("no document")
+            mock_client.update_task.return_value = {
+                "success": True, "task_id": "any", "updated_fields": ["task_name"], "error": None,
             }
             mock_get_client.return_value = mock_client
 
+            result = update_tasks([
+                {"id": "task-001", "task_name": "First"},
+                {"id": "task-002", "task_name": "Second"},
+            ])
+
+            assert "2 of 2 tasks" in result
+
+    def test_update_tasks_identical_uniform_fields_use_one_batch_call(self):
+        """Items setting the same uniform fields go through one client.update_tasks call."""
+        with mock.patch('omnifocus_mcp.server_fastmcp.get_client') as mock_get_client:
+            mock_client = mock.Mock()
+            mock_client.update_tasks.return_value = {
+                "updated_count": 2, "failed_count": 0,
+                "updated_ids": ["task-001", "task-002"], "failures": [],
+            }
+            mock_client.update_task.return_value = {
+                "success": True, "task_id": "task-003", "updated_fields": ["task_name"], "error": None,
+            }
+            mock_get_client.return_value = mock_client
+
+            result = update_tasks([
+                {"id": "task-001", "flagged": True, "due_date": "2026-01-01"},
+                {"id": "task-002", "due_date": "2026-01-01", "flagged": True},
+                {"id": "task-003", "task_name": "Renamed"},
+            ])
+
+            mock_client.update_tasks.assert_called_once_with(
+                ["task-001", "task-002"], due_date="2026-01-01", flagged=True
+            )
+            mock_client.update_task.assert_called_once_with(task_id="task-003", task_name="Renamed")
+            mock_client.set_autosave.assert_not_called()
+            assert "3 of 3 tasks" in result
+            # Same field order update_task reports (flagged before dates)
+            assert "task-001: flagged, due_date" in result
+
+    def test_update_tasks_batch_failures_reported_per_id(self):
+        """IDs a batch call fails are reported from its failures, without re-applying the rest."""
+        with mock.patch('omnifocus_mcp.server_fastmcp.get_client') as mock_get_client:
+            mock_client = mock.Mock()
+            mock_client.update_tasks.return_value = {
+                "updated_count": 1, "failed_count": 1,
+                "updated_ids": ["task-001"],
+                "failures": [{"task_id": "task-404", "error": "Task not found or update failed"}],
+            }
+            mock_get_client.return_value = mock_client
+
+            result = update_tasks([
+                {"id": "task-001", "flagged": True},
+                {"id": "task-404", "flagged": True},
+            ])
+
+            mock_client.update_task.assert_not_called()
+            assert "1 of 2 tasks" in result
+            assert "task-001: flagged" in result
+            assert "task-404: FAILED — Task not found or update failed" in result
+
+    def test_update_tasks_batch_error_reported_without_retry(self):
+        """A batch call that raises is logged and its error reported for every ID."""
+        with mock.patch('omnifocus_mcp.server_fastmcp.get_client') as mock_get_client, \
+                mock.patch('omnifocus_mcp.server_fastmcp.logger') as mock_logger:
+            mock_client = mock.Mock()
+            mock_client.update_tasks.side_effect = Exception("Error batch updating tasks: timeout")
+            mock_get_client.return_value = mock_client
+
             result = update_tasks([
                 {"id": "task-001", "flagged": True},
                 {"id": "task-002", "flagged": True},
             ])
 
-            for call in mock_client.update_task.call_args_list:
-                assert call.kwargs["flagged"] is True
+            mock_client.update_task.assert_not_called()
+            mock_logger.exception.assert_called_once()
+            assert "0 of 2 tasks" in result
+            assert "task-002: FAILED — Error batch updating tasks: timeout" in result
+
+    def test_update_tasks_rejected_batch_applies_items_one_by_one(self):
+        """A ValueError from the batch call (raised before any script) falls back per item."""
+        with mock.patch('omnifocus_mcp.server_fastmcp.get_client') as mock_get_client:
+            mock_client = mock.Mock()
+            mock_client.update_tasks.side_effect = ValueError("Cannot undrop a task via automation.")
+            mock_client.update_task.side_effect = ValueError("Cannot undrop a task via automation.")
+            mock_get_client.return_value = mock_client
+
+            result = update_tasks([
+                {"id": "task-001", "status": "active"},
+                {"id": "task-002", "status": "active"},
+            ])
+
+            assert mock_client.update_task.call_count == 2
+            assert "task-001: FAILED — Cannot undrop" in result
+
+    def test_update_tasks_repeated_ids_apply_in_input_order(self):
+        """A repeated ID disables batching, so a later add_tags cannot run before an earlier tags replace."""
+        with mock.patch('omnifocus_mcp.server_fastmcp.get_client') as mock_get_client:
+            mock_client = mock.Mock()
+            mock_client.update_task.return_value = {
+                "success": True, "task_id": "any", "updated_fields": ["tags"], "error": None,
+            }
+            mock_get_client.return_value = mock_client
+
+            update_tasks([
+                {"id": "t1", "tags": ["a"]},
+                {"id": "t1", "add_tags": ["b"]},
+                {"id": "t2", "add_tags": ["b"]},
+            ])
+
+            mock_client.update_tasks.assert_not_called()
+            assert mock_client.update_task.call_args_list == [
+                mock.call(task_id="t1", tags=["a"]),
+                mock.call(task_id="t1", add_tags=["b"]),
+                mock.call(task_id="t2", add_tags=["b"]),
+            ]
+
+    def test_update_tasks_batches_moves_and_tag_deltas(self):
+        """Identical moves and add_tags go through update_tasks; full tag replacement does not."""
+        with mock.patch('omnifocus_mcp.server_fastmcp.get_client') as mock_get_client:
+            mock_client = mock.Mock()
+            mock_client.update_tasks.return_value = {
+                "updated_count": 2, "failed_count": 0,
+                "updated_ids": ["task-001", "task-002"], "failures": [],
+            }
+            mock_client.update_task.return_value = {
+                "success": True, "task_id": "any", "updated_fields": ["tags"], "error": None,
+            }
+            mock_get_client.return_value = mock_client
+
+            update_tasks([
+                {"id": "task-001", "project_id": "proj-1", "add_tags": ["Home"]},
+                {"id": "task-002", "project_id": "proj-1", "add_tags": ["Home"]},
+                {"id": "task-003", "tags": ["Work"]},
+                {"id": "task-004", "tags": ["Work"]},
+            ])
+
+            mock_client.update_tasks.assert_called_once_with(
+                ["task-001", "task-002"], add_tags=["Home"], project_id="proj-1"
+            )
+            assert mock_client.update_task.call_count == 2
+
+    def test_update_tasks_batch_with_flagged(self):
+        """Unified API: Flagged parameter passed through to the batch call."""
+        with mock.patch('omnifocus_mcp.server_fastmcp.get_client') as mock_get_client:
+            mock_client = mock.Mock()
+            mock_client.update_tasks.return_value = {
+                "updated_count": 2, "failed_count": 0,
+                "updated_ids": ["task-001", "task-002"], "failures": [],
+            }
+            mock_get_client.return_value = mock_client
+
+            result = update_tasks([
+                {"id": "task-001", "flagged": True},
+                {"id": "task-002", "flagged": True},
+            ])
+
+            assert mock_client.update_tasks.call_args.kwargs["flagged"] is True
             assert "2 of 2 tasks" in result
 
     def test_update_tasks_batch_with_completed(self):
@@ -382,11 +560,9 @@ class TestUpdateTasksServerRedesign:
         """Unified API: Response includes success count for multiple tasks."""
         with mock.patch('omnifocus_mcp.server_fastmcp.get_client') as mock_get_client:
             mock_client = mock.Mock()
-            mock_client.update_task.return_value = {
-                "success": True,
-                "task_id": "any",
-                "updated_fields": ["flagged"],
-                "error": None,
+            mock_client.update_tasks.return_value = {
+                "updated_count": 5, "failed_count": 0,
+                "updated_ids": [f"task-{i:03d}" for i in range(5)], "failures": [],
             }
             mock_get_client.return_value = mock_client
 
@@ -400,11 +576,11 @@ class TestUpdateTasksServerRedesign:
         """Unified API: Shows both successes and failures."""
         with mock.patch('omnifocus_mcp.server_fastmcp.get_client') as mock_get_client:
             mock_client = mock.Mock()
-            mock_client.update_task.side_effect = [
-                {"success": True, "task_id": "task-001", "updated_fields": ["flagged"], "error": None},
-                {"success": True, "task_id": "task-002", "updated_fields": ["flagged"], "error": None},
-                {"success": False, "task_id": "task-invalid", "updated_fields": [], "error": "Task not found"},
-            ]
+            mock_client.update_tasks.return_value = {
+                "updated_count": 2, "failed_count": 1,
+                "updated_ids": ["task-001", "task-002"],
+                "failures": [{"task_id": "task-invalid", "error": "Task not found"}],
+            }
             mock_get_client.return_value = mock_client
 
             result = update_tasks([
@@ -420,11 +596,12 @@ class TestUpdateTasksServerRedesign:
         """Unified API: Handles case where all tasks fail."""
         with mock.patch('omnifocus_mcp.server_fastmcp.get_client') as mock_get_client:
             mock_client = mock.Mock()
-            mock_client.update_task.return_value = {
-                "success": False,
-                "task_id": "any",
-                "updated_fields": [],
-                "error": "Task not found",
+            mock_client.update_tasks.return_value = {
+                "updated_count": 0, "failed_count": 2, "updated_ids": [],
+                "failures": [
+                    {"task_id": "task-001", "error": "Task not found"},
+                    {"task_id": "task-002", "error": "Task not found"},
+                ],
             }
             mock_get_client.return_value = mock_client
 
@@ -594,20 +771,10 @@ class TestUpdateTasksUnified:
         """One succeeds, one fails — summary includes both."""
         with mock.patch('omnifocus_mcp.server_fastmcp.get_client') as mock_get_client:
             mock_client = mock.Mock()
-            mock_client.update_task.side_effect = [
-                {
-                    "success": True,
-                    "task_id": "t1",
-                    "updated_fields": ["flagged"],
-                    "error": None,
-                },
-                {
-                    "success": False,
-                    "task_id": "t2",
-                    "updated_fields": [],
-                    "error": "Task not found",
-                },
-            ]
+            mock_client.update_tasks.return_value = {
+                "updated_count": 1, "failed_count": 1, "updated_ids": ["t1"],
+                "failures": [{"task_id": "t2", "error": "Task not found"}],
+            }
             mock_get_client.return_value = mock_client
 
             result = update_tasks([
@@ -101,6 +101,45 @@ class TestUpdateProjectsUnified:
             assert "p2" in result  # Failed ID mentioned
             assert "FAILED" in result or "failed" in result.lower()
 
+    def test_identical_uniform_fields_batched(self):
+        """Projects setting the same uniform fields share one client.update_projects call."""
+        with mock.patch('omnifocus_mcp.server_fastmcp.get_client') as mock_get_client:
+            mock_client = mock.Mock()
+            mock_client.update_projects.return_value = {
+                "updated_count": 2, "failed_count": 0,
+                "updated_ids": ["p1", "p2"], "failures": [],
+            }
+            mock_get_client.return_value = mock_client
+
+            result = server.update_projects(projects=[
+                {"id": "p1", "flagged": True},
+                {"id": "p2", "flagged": True},
+            ])
+
+            mock_client.update_projects.assert_called_once_with(["p1", "p2"], flagged=True)
+            mock_client.update_project.assert_not_called()
+            assert "p1: flagged" in result
+            assert "p2: flagged" in result
+
+    def test_batch_failures_reported_per_id(self):
+        """Failed IDs of a batch call keep their connector error; the rest succeed."""
+        with mock.patch('omnifocus_mcp.server_fastmcp.get_client') as mock_get_client:
+            mock_client = mock.Mock()
+            mock_client.update_projects.return_value = {
+                "updated_count": 1, "failed_count": 1, "updated_ids": ["p1"],
+                "failures": [{"project_id": "p2", "error": "Project not found or update failed"}],
+            }
+            mock_get_client.return_value = mock_client
+
+            result = server.update_projects(projects=[
+                {"id": "p1", "flagged": True},
+                {"id": "p2", "flagged": True},
+            ])
+
+            mock_client.update_project.assert_not_called()
+            assert "p1: flagged" in result
+            assert "p2: FAILED — Project not found or update failed" in result
+
     def test_all_fields_passthrough(self):
         """Verify model_dump passes all fields to connector."""
         with mock.patch('omnifocus_mcp.server_fastmcp.get_client') as mock_get_client:
@@ -326,32 +326,43 @@ class TestBuildPerTaskUpdateCommands:
 
     def test_completed_false(self, client):
         """Completed false generates per-task set completed command."""
-        cmds, has = self._call(client, completed=False)
+        _, cmds, has = self._call(client, completed=False)
         assert has is True
         assert any('set completed' in c for c in cmds)
 
     def test_status_dropped(self, client):
         """Dropped status generates per-task mark dropped command."""
-        cmds, _ = self._call(client, status="dropped")
+        _, cmds, _ = self._call(client, status="dropped")
         assert any('mark dropped' in c for c in cmds)
 
     def test_tags_replacement(self, client):
         """Full tag replacement generates per-task newTags command block."""
-        cmds, _ = self._call(client, tags=["work"])
+        _, cmds, _ = self._call(client, tags=["work"])
         assert any('newTags' in c for c in cmds)
 
     def test_add_tags(self, client):
-        """Add tags generates per-task add tagObj commands."""
-        cmds, _ = self._call(client, add_tags=["urgent"])
-        assert any('add tagObj' in c for c in cmds)
+        """Add tags generates per-task add commands for pre-resolved tags."""
+        _, cmds, _ = self._call(client, add_tags=["urgent"])
+        assert any('add addTag1 to tags of theTask' in c for c in cmds)
 
     def test_remove_tags(self, client):
-        """Remove tags generates per-task remove tagObj commands."""
-        cmds, _ = self._call(client, remove_tags=["old"])
-        assert any('remove tagObj' in c for c in cmds)
+        """Remove tags generates per-task remove commands for pre-resolved tags."""
+        _, cmds, _ = self._call(client, remove_tags=["old"])
+        assert any('remove removeTag1 from tags of theTask' in c for c in cmds)
+
+    def test_tag_lookups_hoisted_out_of_loop(self, client):
+        """Tag names are resolved once in lookup commands, not per task."""
+        lookups, cmds, _ = self._call(client, add_tags=["urgent", "work"], remove_tags=["old"])
+        lookups_str = "\n".join(lookups)
+        assert 'set addTag1 to first flattened tag whose name is "urgent"' in lookups_str
+        assert 'set addTag2 to first flattened tag whose name is "work"' in lookups_str
+        assert 'set removeTag1 to first flattened tag whose name is "old"' in lookups_str
+        assert not any('flattened tag whose' in c for c in cmds)
+        assert any('if addTag1 is missing value then error' in c for c in cmds)
 
     def test_no_fields_empty(self, client):
         """No fields returns empty commands list and no-per-task flag."""
-        cmds, has = self._call(client)
+        lookups, cmds, has = self._call(client)
+        assert lookups == []
         assert cmds == []
         assert has is False